@@ -5,4 +5,11 @@ from . import _version
 __author__ = "Paul Gierz <pgierz@awi.de>"
 __all__ = []
 
-__version__ = _version.get_versions()["version"]
+
+def __getattr__(name):
+    # NOTE(PG): Resolving the version may shell out to git (in a source checkout),
+    #           so only do it the first time someone actually asks for it.
+    if name == "__version__":
+        version = globals()["__version__"] = _version.get_versions()["version"]
+        return version
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,3 +1,8 @@
+import copy
+import functools
+import importlib
+import importlib.util
+import marshal
 import os
 import sys
 from importlib import resources
@@ -7,20 +12,17 @@ import pkg_resources
 import rich_click as click
 import yaml
 from click_loguru import ClickLoguru
-from dask.distributed import Client
 from rich.traceback import install as rich_traceback_install
-from streamlit.web import cli as stcli
 
 from . import _version
-from .core import caching
-from .core.cmorizer import CMORizer
-from .core.filecache import fc
 from .core.logging import add_report_logger, logger
 from .core.ssh_tunnel import ssh_tunnel_cli
 from .core.validate import GENERAL_VALIDATOR, PIPELINES_VALIDATOR, RULES_VALIDATOR
 from .dev import utils as dev_utils
-from .fesom_1p4.nodes_to_levels import convert
-from .scripts.update_dimensionless_mappings import update_dimensionless_mappings
+
+# NOTE(PG): Heavy dependencies (dask, streamlit, prefect, the CMORizer, ...) are
+#           imported inside the commands that need them, so that ``pycmor --help``
+#           and friends stay snappy.
 
 MAX_FRAMES = int(
     os.environ.get(
@@ -30,8 +32,44 @@ MAX_FRAMES = int(
 """
 str: The maximum number of frames to show in the traceback if there is an error. Default to 3
 """
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+"""
+yaml.Loader: The YAML loader used for configuration files. Uses libyaml's C loader if available.
+"""
+TRACEBACK_LOCALS = os.environ.get(
+    "PYCMOR_TRACEBACK_LOCALS", os.environ.get("PYMOR_TRACEBACK_LOCALS", "0")
+).lower() in ("1", "true", "yes", "on")
+"""
+bool: Whether to show local variables in tracebacks. Rendering the locals of frames
+holding large xarray objects can be very slow, so this is off by default.
+"""
+TRACEBACK_SUPPRESS = ["click", "dask", "distributed", "prefect"]
+"""
+list: Packages whose frames are hidden in tracebacks.
+"""
+
+
+def _traceback_suppress_paths():
+    """Locates the packages in ``TRACEBACK_SUPPRESS`` without importing them"""
+    paths = []
+    for name in TRACEBACK_SUPPRESS:
+        spec = importlib.util.find_spec(name)
+        if spec is not None and spec.origin is not None:
+            paths.append(os.path.dirname(spec.origin))
+    return paths
+
+
 # install rich traceback
-rich_traceback_install(show_locals=True, max_frames=MAX_FRAMES)
+rich_traceback_install(
+    show_locals=TRACEBACK_LOCALS,
+    max_frames=MAX_FRAMES,
+    suppress=_traceback_suppress_paths(),
+)
+
+CONFIG_SECTIONS = ["general", "pipelines", "rules"]
+"""
+list: The top-level sections of a pycmor configuration file which can be validated.
+"""
 
 VERSION = _version.get_versions()["version"]
 
@@ -48,6 +86,69 @@ click_loguru = ClickLoguru(
 )
 
 
+class LazyGroup(click.RichGroup):
+    """
+    A click group which only imports its subcommands when they are requested.
+
+    Subcommands are given as a mapping of command name to either an import string
+    of the form ``"package.module:attribute"`` or an entry point, which is only
+    loaded once the command is actually needed. Listing the commands in the help
+    text does not count: plugin entry points that were not loaded yet are shown
+    with a placeholder description instead.
+    """
+
+    def __init__(self, *args, lazy_subcommands=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+        self._loaded_subcommands = {}
+        self._formatting_help = False
+
+    def list_commands(self, ctx):
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_subcommands:
+            if self._formatting_help and cmd_name not in self._loaded_subcommands:
+                target = self.lazy_subcommands[cmd_name]
+                if not isinstance(target, str):
+                    return self._placeholder(cmd_name, target)
+            return self._lazy_load(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def format_help(self, ctx, formatter):
+        # NOTE(PG): The help text looks up every listed command with get_command,
+        #           which would import every installed plugin just to print its name.
+        self._formatting_help = True
+        try:
+            super().format_help(ctx, formatter)
+        finally:
+            self._formatting_help = False
+
+    @staticmethod
+    def _placeholder(cmd_name, entry_point):
+        plugin_name = entry_point.module_name.split(".")[0]
+        return click.Command(
+            cmd_name, short_help=f"Provided by the {plugin_name} plugin."
+        )
+
+    def _lazy_load(self, cmd_name):
+        if cmd_name in self._loaded_subcommands:
+            return self._loaded_subcommands[cmd_name]
+        target = self.lazy_subcommands[cmd_name]
+        if isinstance(target, str):
+            module_name, attr_name = target.split(":")
+            module = importlib.import_module(module_name)
+            cmd_object = getattr(module, attr_name)
+        else:
+            cmd_object = target.load()
+        if not isinstance(cmd_object, click.Command):
+            raise ValueError(
+                f"Lazy loading of {cmd_name} failed, {cmd_object} is not a click Command"
+            )
+        self._loaded_subcommands[cmd_name] = cmd_object
+        return cmd_object
+
+
 # FIXME(PG): Doesn't work as intended :-(
 def pymor_cli_group(func):
     """
@@ -62,23 +163,161 @@ def pymor_cli_group(func):
     return func
 
 
+def load_config_sections(config_file, sections=None):
+    """
+    Loads a YAML configuration file, optionally constructing only some top-level sections.
+
+    The document is first composed into a node graph; only the requested sections
+    are then turned into Python objects. Anchors and aliases shared between sections
+    are still resolved, since they are part of the composed graph.
+
+    Parameters
+    ----------
+    config_file : str
+        Path to the YAML configuration file.
+    sections : iterable of str, optional
+        The top-level keys to construct. If None, the whole document is loaded.
+
+    Returns
+    -------
+    dict
+        The (possibly partial) configuration.
+    """
+    with open(config_file, "rb") as f:
+        loader = Loader(f)
+        try:
+            root = loader.get_single_node()
+            if root is None:
+                return {}
+            # Only a mapping can be split into sections; anything else is
+            # constructed whole and left for the validator to reject.
+            if sections is None or not isinstance(root, yaml.MappingNode):
+                return loader.construct_document(root)
+            # Resolve top-level merge keys (<<) before picking sections
+            loader.flatten_mapping(root)
+            return {
+                key_node.value: loader.construct_document(value_node)
+                for key_node, value_node in root.value
+                if key_node.value in sections
+            }
+        finally:
+            loader.dispose()
+
+
+_ATOMIC_TYPES = frozenset({str, int, float, bool, type(None), bytes})
+"""frozenset: Immutable scalar types which can be shared between copies instead of copied."""
+
+
+def _naive_deepcopy(obj, memo):
+    """
+    Deep-copies a tree of dicts and lists, sharing immutable scalars.
+
+    Scalars are returned as they are, without the dispatch and memo bookkeeping
+    ``copy.deepcopy`` does for every node. Dicts and lists are memoized by ``id()``,
+    so sub-trees referenced twice (e.g. through YAML aliases) are still shared in
+    the copy. Anything else is handed to ``copy.deepcopy`` with the same memo.
+    """
+    typ = type(obj)
+    if typ in _ATOMIC_TYPES:
+        return obj
+    key = id(obj)
+    if key in memo:
+        return memo[key]
+    if typ is dict:
+        # Register the copy before filling it, in case the tree refers back to it
+        new = memo[key] = {}
+        for k, v in obj.items():
+            new[_naive_deepcopy(k, memo)] = _naive_deepcopy(v, memo)
+        return new
+    if typ is list:
+        new = memo[key] = []
+        new.extend(_naive_deepcopy(v, memo) for v in obj)
+        return new
+    return copy.deepcopy(obj, memo)
+
+
+def _fast_deepcopy(obj):
+    """
+    Deep-copies a tree of builtin containers and scalars.
+
+    ``marshal`` copies plain ``dict``/``list``/``str``/number trees much faster than
+    ``copy.deepcopy``, which dispatches and memoizes on every node. YAML may also
+    produce types marshal cannot handle (e.g. dates), in which case we fall back
+    to a type-specialised recursive copy.
+    """
+    try:
+        return marshal.loads(marshal.dumps(obj))
+    except ValueError:
+        return _naive_deepcopy(obj, {})
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(config_file, mtime_ns):
+    """Loads (and caches) a configuration file. ``mtime_ns`` is only part of the cache key."""
+    return load_config_sections(config_file)
+
+
+def load_config(config_file):
+    """
+    Loads a YAML configuration file, reusing earlier results from the same process.
+
+    Results are cached per path and modification time, so an edited file is
+    always read again. A deep copy is returned, since consumers such as
+    ``CMORizer.from_dict`` may modify the configuration in place.
+
+    Parameters
+    ----------
+    config_file : str
+        Path to the YAML configuration file.
+
+    Returns
+    -------
+    dict
+        The configuration.
+    """
+    config_file = os.path.abspath(config_file)
+    cfg = _load_config_cached(config_file, os.stat(config_file).st_mtime_ns)
+    return _fast_deepcopy(cfg)
+
+
+SUBCOMMAND_GROUPS = ["pycmor.cli_subcommands", "pymor.cli_subcommands"]
+"""
+list: Entry point groups searched for CLI subcommands, new group first, legacy group second.
+"""
+
+
+@functools.lru_cache(maxsize=None)
+def _iter_subcommand_entry_points(group):
+    """Returns the (cached) entry points registered for a subcommand group"""
+    return tuple(pkg_resources.iter_entry_points(group))
+
+
+def find_subcommand_entry_points():
+    """
+    Finds CLI Subcommand entry points for installed plugins without loading them.
+    """
+    discovered_entry_points = {}
+    for group in SUBCOMMAND_GROUPS:
+        for entry_point in _iter_subcommand_entry_points(group):
+            discovered_entry_points[entry_point.name] = entry_point
+    return discovered_entry_points
+
+
 def find_subcommands():
     """
     Finds CLI Subcommands for installed plugins in both legacy and new groups.
     """
-    groups = ["pycmor.cli_subcommands", "pymor.cli_subcommands"]
     discovered_subcommands = {}
-    for group in groups:
-        for entry_point in pkg_resources.iter_entry_points(group):
-            discovered_subcommands[entry_point.name] = {
-                "plugin_name": entry_point.module_name.split(".")[0],
-                "callable": entry_point.load(),
-            }
+    for name, entry_point in find_subcommand_entry_points().items():
+        discovered_subcommands[name] = {
+            "plugin_name": entry_point.module_name.split(".")[0],
+            "callable": entry_point.load(),
+        }
     return discovered_subcommands
 
 
 @click_loguru.logging_options
-@click.group(name="pycmor", help="PyCMOR - Makes CMOR Simple")
+@click.group(name="pycmor", help="PyCMOR - Makes CMOR Simple", cls=LazyGroup)
 @click_loguru.stash_subcommand()
 @click.version_option(version=VERSION, prog_name=NAME)
 def cli(verbose, quiet, logfile, profile_mem):
@@ -98,12 +337,15 @@ def cli(verbose, quiet, logfile, profile_mem):
 @click_loguru.init_logger()
 @click.argument("config_file", type=click.Path(exists=True))
 def process(config_file):
+    from dask.distributed import Client
+
+    from .core.cmorizer import CMORizer
+
     # NOTE(PG): The ``init_logger`` decorator above removes *ALL* previously configured loggers,
     #           so we need to re-create the report logger here. Paul does not like this at all.
     add_report_logger()
     logger.info(f"Processing {config_file}")
-    with open(config_file, "r") as f:
-        cfg = yaml.safe_load(f)
+    cfg = load_config(config_file)
     cmorizer = CMORizer.from_dict(cfg)
     client = Client(cmorizer._cluster)  # noqa: F841
     cmorizer.process()
@@ -113,27 +355,27 @@ def process(config_file):
 @click_loguru.init_logger()
 @click.argument("config_file", type=click.Path(exists=True))
 def prefect_check(config_file):
+    from dask.distributed import Client
+
+    from .core.cmorizer import CMORizer
+
     add_report_logger()
     logger.info(f"Checking prefect with dummy flow using {config_file}")
-    with open(config_file, "r") as f:
-        cfg = yaml.safe_load(f)
-        cmorizer = CMORizer.from_dict(cfg)
-        client = Client(cmorizer._cluster)  # noqa: F841
-        cmorizer.check_prefect()
+    cfg = load_config(config_file)
+    cmorizer = CMORizer.from_dict(cfg)
+    client = Client(cmorizer._cluster)  # noqa: F841
+    cmorizer.check_prefect()
 
 
 @cli.command()
 @click_loguru.init_logger()
 def table_explorer():
+    from streamlit.web import cli as stcli
+
     logger.info("Launching table explorer...")
-    try:
-        with resources.path("pycmor", "webapp.py") as webapp_path:
-            sys.argv = ["streamlit", "run", str(webapp_path)]
-            stcli.main()
-            return
-    except Exception:
-        pass
-    with resources.path("pymor", "webapp.py") as webapp_path:
+    webapp = resources.files(__package__).joinpath("webapp.py")
+    # NOTE(PG): as_file only extracts to a temporary file if the package is zipped
+    with resources.as_file(webapp) as webapp_path:
         sys.argv = ["streamlit", "run", str(webapp_path)]
         stcli.main()
 
@@ -165,7 +407,12 @@ def cache(verbose, quiet, logfile, profile_mem):
     return 0
 
 
-@click.group()
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "update-dimensionless-mappings": "pycmor.scripts.update_dimensionless_mappings:update_dimensionless_mappings",
+    },
+)
 def scripts():
     """Various utility scripts for Pycmor."""
     return 0
@@ -205,35 +452,49 @@ def ls(directory, output_file, verbose, quiet, logfile, profile_mem):
 @click_loguru.logging_options
 @click_loguru.init_logger()
 @click.argument("config_file", type=click.Path(exists=True))
-def config(config_file, verbose, quiet, logfile, profile_mem):
+@click.option(
+    "--section",
+    "sections",
+    type=click.Choice(CONFIG_SECTIONS),
+    multiple=True,
+    help="Only validate the given section(s) of the configuration. Can be given multiple times.",
+)
+def config(config_file, sections, verbose, quiet, logfile, profile_mem):
     logger.info(f"Checking if a CMORizer can be built from {config_file}")
-    with open(config_file, "r") as f:
-        cfg = yaml.safe_load(f)
-        if "pipelines" in cfg:
-            pipelines = cfg["pipelines"]
-            PIPELINES_VALIDATOR.validate({"pipelines": pipelines})
-        if "rules" in cfg:
-            rules = cfg["rules"]
-            RULES_VALIDATOR.validate({"rules": rules})
-        if "general" in cfg:
-            general = cfg["general"]
-            GENERAL_VALIDATOR.validate({"general": general})
-        if not any(
-            [
-                PIPELINES_VALIDATOR.errors,
-                RULES_VALIDATOR.errors,
-                GENERAL_VALIDATOR.errors,
-            ]
-        ):
+    if sections:
+        cfg = load_config_sections(config_file, sections)
+    else:
+        cfg = load_config(config_file)
+    if "pipelines" in cfg:
+        pipelines = cfg["pipelines"]
+        PIPELINES_VALIDATOR.validate({"pipelines": pipelines})
+    if "rules" in cfg:
+        rules = cfg["rules"]
+        RULES_VALIDATOR.validate({"rules": rules})
+    if "general" in cfg:
+        general = cfg["general"]
+        GENERAL_VALIDATOR.validate({"general": general})
+    if not any(
+        [
+            PIPELINES_VALIDATOR.errors,
+            RULES_VALIDATOR.errors,
+            GENERAL_VALIDATOR.errors,
+        ]
+    ):
+        if sections:
+            logger.success(
+                f"Configuration {config_file} is valid for {', '.join(sections)}!"
+            )
+        else:
             logger.success(
                 f"Configuration {config_file} is valid for general settings, rules, and pipelines!"
             )
-        for key, error in {
-            **GENERAL_VALIDATOR.errors,
-            **PIPELINES_VALIDATOR.errors,
-            **RULES_VALIDATOR.errors,
-        }.items():
-            logger.error(f"{key}: {error}")
+    for key, error in {
+        **GENERAL_VALIDATOR.errors,
+        **PIPELINES_VALIDATOR.errors,
+        **RULES_VALIDATOR.errors,
+    }.items():
+        logger.error(f"{key}: {error}")
 
 
 @validate.command()
@@ -242,11 +503,12 @@ def config(config_file, verbose, quiet, logfile, profile_mem):
 @click.argument("config_file", type=click.Path(exists=True))
 @click.argument("table_name", type=click.STRING)
 def table(config_file, table_name, verbose, quiet, logfile, profile_mem):
+    from .core.cmorizer import CMORizer
+
     logger.info(f"Processing {config_file}")
-    with open(config_file, "r") as f:
-        cfg = yaml.safe_load(f)
-        cmorizer = CMORizer.from_dict(cfg)
-        cmorizer.check_rules_for_table(table_name)
+    cfg = load_config(config_file)
+    cmorizer = CMORizer.from_dict(cfg)
+    cmorizer.check_rules_for_table(table_name)
 
 
 @validate.command()
@@ -255,11 +517,12 @@ def table(config_file, table_name, verbose, quiet, logfile, profile_mem):
 @click.argument("config_file", type=click.Path(exists=True))
 @click.argument("output_dir", type=click.STRING)
 def directory(config_file, output_dir, verbose, quiet, logfile, profile_mem):
+    from .core.cmorizer import CMORizer
+
     logger.info(f"Processing {config_file}")
-    with open(config_file, "r") as f:
-        cfg = yaml.safe_load(f)
-        cmorizer = CMORizer.from_dict(cfg)
-        cmorizer.check_rules_for_output_dir(output_dir)
+    cfg = load_config(config_file)
+    cmorizer = CMORizer.from_dict(cfg)
+    cmorizer.check_rules_for_output_dir(output_dir)
 
 
 ################################################################################
@@ -271,16 +534,16 @@ def directory(config_file, output_dir, verbose, quiet, logfile, profile_mem):
 ################################################################################
 
 
-@scripts.group()
+@scripts.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "nodes-to-levels": "pycmor.fesom_1p4.nodes_to_levels:convert",
+    },
+)
 def fesom1():
     pass
 
 
-fesom1.add_command(convert, name="nodes-to-levels")
-
-# Add scripts commands
-scripts.add_command(update_dimensionless_mappings)
-
 ################################################################################
 ################################################################################
 ################################################################################
@@ -300,6 +563,8 @@ scripts.add_command(update_dimensionless_mappings)
 )
 def inspect_prefect_global(cache_dir, verbose, quiet, logfile, profile_mem):
     """Print information about items in Prefect's storage cache"""
+    from .core import caching
+
     logger.info(f"Inspecting Prefect Cache at {cache_dir}")
     caching.inspect_cache(cache_dir)
     return 0
@@ -313,6 +578,8 @@ def inspect_prefect_global(cache_dir, verbose, quiet, logfile, profile_mem):
     type=click.Path(exists=True),
 )
 def inspect_prefect_result(result, verbose, quiet, logfile, profile_mem):
+    from .core import caching
+
     obj = caching.inspect_result(result)
     logger.info(obj)
     return 0
@@ -322,6 +589,8 @@ def inspect_prefect_result(result, verbose, quiet, logfile, profile_mem):
 @click_loguru.logging_options
 @click.argument("files", type=click.Path(exists=True), nargs=-1)
 def populate_cache(files: List, verbose, quiet, logfile, profile_mem):
+    from .core.filecache import fc
+
     fc.add_files(files)
     fc.save()
 
@@ -353,8 +622,8 @@ cli.add_command(cache)
 
 
 def main():
-    for entry_point_name, entry_point in find_subcommands().items():
-        cli.add_command(entry_point["callable"], name=entry_point_name)
+    # Plugins are only imported once their subcommand is actually invoked:
+    cli.lazy_subcommands.update(find_subcommand_entry_points())
     # Prefer new env var prefix, but keep backward compatibility
     cli(auto_envvar_prefix="PYCMOR")
 
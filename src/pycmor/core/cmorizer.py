@@ -1,7 +1,6 @@
 import copy
 import getpass
 import os
-from importlib.resources import files
 from pathlib import Path
 
 import dask  # noqa: F401
@@ -20,6 +19,7 @@ from ..data_request.table import DataRequestTable
 from ..data_request.variable import DataRequestVariable
 from ..std_lib.global_attributes import GlobalAttributes
 from ..std_lib.timeaverage import _frequency_from_approx_interval
+from . import filecache
 from .aux_files import attach_files_to_rule
 from .cluster import (
     CLUSTER_ADAPT_SUPPORT,
@@ -28,21 +28,19 @@ from .cluster import (
     DaskContext,
     set_dashboard_link,
 )
-from .config import PycmorConfig, PycmorConfigManager
+from .config import DIMENSIONLESS_MAPPING_TABLE, PycmorConfig, PycmorConfigManager
 from .controlled_vocabularies import ControlledVocabularies
 from .factory import create_factory
-from .filecache import fc
 from .logging import logger
 from .pipeline import Pipeline
 from .rule import Rule
 from .utils import wait_for_workers
 from .validate import GENERAL_VALIDATOR, PIPELINES_VALIDATOR, RULES_VALIDATOR
 
-DIMENSIONLESS_MAPPING_TABLE = files("pycmor.data").joinpath(
-    "dimensionless_mappings.yaml"
-)
-"""Path: The dimenionless unit mapping table, used to recreate meaningful units from
-dimensionless fractional values (e.g. 0.001 --> g/kg)"""
+Dumper = getattr(yaml, "CDumper", yaml.Dumper)
+"""type: The fastest available YAML dumper, used when echoing configuration to the log."""
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+"""type: The fastest available safe YAML loader, libyaml's C loader if PyYAML was built with it."""
 
 
 class CMORizer:
@@ -88,7 +86,10 @@ class CMORizer:
         logger.debug("---------------------")
         logger.debug("General Configuration")
         logger.debug("---------------------")
-        logger.debug(yaml.dump(self._general_cfg))
+        # NOTE(PG): lazy, so the configuration is only serialized if debug output is shown
+        logger.opt(lazy=True).debug(
+            "{}", lambda: yaml.dump(self._general_cfg, Dumper=Dumper)
+        )
         logger.debug("--------------------")
         logger.debug("PyCMOR Configuration:")
         logger.debug("--------------------")
@@ -101,7 +102,7 @@ class CMORizer:
         ):
             full_key = generate_uppercase_key(key, namespace)
             _pymor_config_dict[full_key] = value
-        logger.info(yaml.dump(_pymor_config_dict))
+        logger.info(yaml.dump(_pymor_config_dict, Dumper=Dumper))
         # Avoid confusion:
         del pymor_config
         logger.info(80 * "#")
@@ -170,7 +171,7 @@ class CMORizer:
         }
 
         logger.info("Updating Dask configuration. Changed values will be:")
-        logger.info(yaml.dump(self._dask_cfg))
+        logger.info(yaml.dump(self._dask_cfg, Dumper=Dumper))
         dask.config.update(dask.config.config, self._dask_cfg)
         logger.info("Dask configuration updated!")
 
@@ -243,11 +244,18 @@ class CMORizer:
     def _post_init_create_data_request(self):
         """
         Creates a DataRequest object from the tables directory.
+
+        The tables loaded by ``_post_init_create_data_request_tables`` are reused,
+        rather than parsing the whole tables directory a second time.
         """
-        table_dir = self._general_cfg["CMIP_Tables_Dir"]
         data_request_factory = create_factory(DataRequest)
         DataRequestClass = data_request_factory.get(self.cmor_version)
-        self.data_request = DataRequestClass.from_directory(table_dir)
+        tables = self._general_cfg.get("tables")
+        if tables is None:
+            table_dir = self._general_cfg["CMIP_Tables_Dir"]
+            self.data_request = DataRequestClass.from_directory(table_dir)
+        else:
+            self.data_request = DataRequestClass.from_tables(tables)
 
     def _post_init_populate_rules_with_tables(self):
         """
@@ -260,8 +268,16 @@ class CMORizer:
                     rule.add_table(tbl.table_id)
 
     def _post_init_populate_rules_with_data_request_variables(self):
+        # NOTE(PG): Index the rules by cmor_variable once, so that each data request
+        #           variable only has to be compared against its candidate rules,
+        #           rather than against every rule.
+        rules_by_cmor_variable = {}
+        for rule in self.rules:
+            rules_by_cmor_variable.setdefault(rule.cmor_variable, []).append(rule)
         for drv in self.data_request.variables.values():
-            rule_for_var = self.find_matching_rule(drv)
+            rule_for_var = self.find_matching_rule(
+                drv, rules=rules_by_cmor_variable.get(drv.variable_id, [])
+            )
             if rule_for_var is None:
                 continue
             if rule_for_var.data_request_variables == []:
@@ -325,7 +341,7 @@ class CMORizer:
             dimensionless_unit_mappings = {}
         else:
             with open(unit_map_file, "r") as f:
-                dimensionless_unit_mappings = yaml.safe_load(f)
+                dimensionless_unit_mappings = yaml.load(f, Loader=Loader)
         # Add to rules:
         for rule in self.rules:
             rule.dimensionless_unit_mappings = dimensionless_unit_mappings
@@ -335,11 +351,11 @@ class CMORizer:
             rule.match_pipelines(self.pipelines, force=force)
 
     def find_matching_rule(
-        self, data_request_variable: DataRequestVariable
+        self, data_request_variable: DataRequestVariable, rules=None
     ) -> Rule or None:
         matches = []
         attr_criteria = [("cmor_variable", "variable_id")]
-        for rule in self.rules:
+        for rule in self.rules if rules is None else rules:
             if all(
                 getattr(rule, r_attr) == getattr(data_request_variable, drv_attr)
                 for (r_attr, drv_attr) in attr_criteria
@@ -410,13 +426,13 @@ class CMORizer:
 
     def _post_init_create_pipelines(self):
         pipelines = []
+        default_workflow_backend = self._pymor_cfg("pipeline_workflow_orchestrator")
         for p in self.pipelines:
             if isinstance(p, Pipeline):
                 pipelines.append(p)
             elif isinstance(p, dict):
                 p["workflow_backend"] = p.get(
-                    "workflow_backend",
-                    self._pymor_cfg("pipeline_workflow_orchestrator"),
+                    "workflow_backend", default_workflow_backend
                 )
                 pl = Pipeline.from_dict(p)
                 if self._cluster is not None:
@@ -477,7 +493,7 @@ class CMORizer:
                     if not input_collection.files:
                         logger.info("No. input files found. Skipping frequency check.")
                         break
-                    data_freq = fc.get(input_collection.files[0]).freq
+                    data_freq = filecache.fc.get(input_collection.files[0]).freq
                 is_subperiod = pd.tseries.frequencies.is_subperiod(
                     data_freq, table_freq
                 )
@@ -515,7 +531,7 @@ class CMORizer:
                     filename = input_collection.files[0]
                 except IndexError:
                     break
-                model_unit = rule.get("model_unit") or fc.get(filename).units
+                model_unit = rule.get("model_unit") or filecache.fc.get(filename).units
                 cmor_unit = rule.data_request_variable.units
                 cmor_variable = rule.data_request_variables.get("cmor_variable")
                 if model_unit is None:
@@ -559,15 +575,18 @@ class CMORizer:
         for rule in data.get("rules", []):
             rule_obj = Rule.from_dict(rule)
             instance.add_rule(rule_obj)
-            instance._post_init_attach_pymor_config_rules()
+        # NOTE(PG): Attach the configuration once all rules are there. Doing it per
+        #           added rule deep-copied the configuration onto every earlier rule
+        #           again, i.e. quadratically in the number of rules.
+        instance._post_init_attach_pymor_config_rules()
         instance._post_init_inherit_rules()
         if "pipelines" in data:
             if not PIPELINES_VALIDATOR.validate({"pipelines": data["pipelines"]}):
                 raise ValueError(PIPELINES_VALIDATOR.errors)
+        default_workflow_backend = instance._pymor_cfg("pipeline_workflow_orchestrator")
         for pipeline in data.get("pipelines", []):
             pipeline["workflow_backend"] = pipeline.get(
-                "workflow_backend",
-                instance._pymor_cfg("pipeline_workflow_orchestrator"),
+                "workflow_backend", default_workflow_backend
             )
             pipeline_obj = Pipeline.from_dict(pipeline)
             instance.add_pipeline(pipeline_obj)
@@ -604,6 +623,14 @@ class CMORizer:
                     matching_rules.append(rule)
         return matching_rules
 
+    def _has_rule_for_filepath(self, filepath):
+        filepath = str(filepath)
+        return any(
+            pattern.match(filepath)
+            for rule in self.rules
+            for pattern in rule.input_patterns
+        )
+
     def _rule_for_cmor_variable(self, cmor_variable):
         matching_rules = []
         for rule in self.rules:
@@ -630,12 +657,11 @@ class CMORizer:
             )
 
     def check_rules_for_output_dir(self, output_dir):
-        all_files_in_output_dir = [f for f in Path(output_dir).iterdir()]
-        for rule in self.rules:
-            # Remove files from list when matching a rule
-            for filepath in all_files_in_output_dir:
-                if self._rule_for_filepath(filepath):
-                    all_files_in_output_dir.remove(filepath)
+        # NOTE(PG): One pass is enough, each file is checked against all rules at once,
+        #           and we stop at the first matching pattern instead of collecting all.
+        all_files_in_output_dir = [
+            f for f in Path(output_dir).iterdir() if not self._has_rule_for_filepath(f)
+        ]
         if all_files_in_output_dir:
             logger.warning("This CMORizer may be incomplete or badly configured!")
             logger.warning(
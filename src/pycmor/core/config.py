@@ -88,6 +88,8 @@ from everett.manager import (
 DIMENSIONLESS_MAPPING_TABLE = files("pycmor.data").joinpath(
     "dimensionless_mappings.yaml"
 )
+"""Path: The dimenionless unit mapping table, used to recreate meaningful units from
+dimensionless fractional values (e.g. 0.001 --> g/kg)"""
 
 
 def _parse_bool(value):
@@ -6,11 +6,12 @@ import glob
 import json
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
-import requests
-
 from .factory import MetaFactory
+from .utils import MAX_DOWNLOAD_WORKERS, thread_local_sessions
 
 
 class ControlledVocabularies(dict, metaclass=MetaFactory):
@@ -133,15 +134,20 @@ class CMIP6ControlledVocabularies(ControlledVocabularies):
             "mip_era.json",
         )
         name_pattern = re.compile(r"^(?:CMIP6_)?(?P<name>[^\.]+)\.json$").match
-        data = {}
-        for fname in filenames:
+
+        def fetch(get_session, fname):
             name = name_pattern(fname).groupdict().get("name")
             fpath = "/".join([url, fname])
-            r = requests.get(fpath)
+            r = get_session().get(fpath)
             r.raise_for_status()
-            content = r.content.decode()
-            content = json.loads(content)
-            data[name] = content.get(name)
+            # json can parse the raw bytes directly
+            content = json.loads(r.content)
+            return name, content.get(name)
+
+        # The files are independent, so fetch them concurrently, one session per worker:
+        with thread_local_sessions() as get_session:
+            with ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS) as executor:
+                data = dict(executor.map(partial(fetch, get_session), filenames))
         obj = cls([])
         obj.update(data)
         return obj
@@ -699,7 +699,21 @@ class Filecache:
         return series
 
 
-fc = Filecache.load()
+def _get_filecache() -> Filecache:
+    """Return the shared file cache, loading it from disk on first use."""
+    fc = globals().get("fc")
+    if fc is None:
+        fc = globals()["fc"] = Filecache.load()
+    return fc
+
+
+def __getattr__(name):
+    # NOTE(PG): Loading the cache reads (and possibly creates) the cache file on
+    #           disk, so only do it the first time someone actually asks for ``fc``,
+    #           not whenever this module is imported.
+    if name == "fc":
+        return _get_filecache()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 @atexit.register
@@ -709,8 +723,11 @@ def _save():
 
     This function is registered to execute at program exit using `atexit.register`.
     It triggers the `save` method of the `fc` object, which saves the file cache.
+    If the cache was never loaded, there is nothing to save.
     """
-    fc.save()
+    fc = globals().get("fc")
+    if fc is not None:
+        fc.save()
 
 
 def register_cache(ds):
@@ -728,5 +745,5 @@ def register_cache(ds):
     xr.Dataset
     """
     filename = ds.encoding["source"]
-    fc.add_file(filename)
+    _get_filecache().add_file(filename)
     return ds
@@ -100,6 +100,10 @@ class Frequency:
         The time method of the frequency.
     """
 
+    # NOTE(PG): Frequencies are compared and sorted a lot, but only ever hold
+    # these three attributes, so they do not need a per-instance __dict__
+    __slots__ = ("name", "approx_interval", "time_method")
+
     def __init__(self, name, approx_interval, time_method=TimeMethods.MEAN):
         self.name = name
         self.approx_interval = approx_interval
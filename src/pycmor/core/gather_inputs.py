@@ -44,11 +44,14 @@ class InputFileCollection:
     @property
     def files(self):
         files = []
-        for file in list(self.path.iterdir()):
-            if self.pattern.match(
-                file.name
-            ):  # Check if the filename matches the pattern
-                files.append(file)
+        # NOTE(PG): os.scandir hands out light-weight DirEntry objects, so we only
+        #           build Path objects for the entries which actually match.
+        with os.scandir(self.path) as entries:
+            for entry in entries:
+                if self.pattern.match(
+                    entry.name
+                ):  # Check if the filename matches the pattern
+                    files.append(self.path / entry.name)
         return files
 
     @classmethod
@@ -155,7 +158,13 @@ def _input_files_in_path(path: pathlib.Path or str, pattern: re.Pattern) -> list
         A list of files in the directory that match the pattern.
     """
     path = pathlib.Path(path)
-    return [f for f in path.iterdir() if f.is_file() and pattern.match(f.name)]
+    # Match the (cheap) name first; DirEntry.is_file usually needs no extra stat call
+    with os.scandir(path) as entries:
+        return [
+            path / entry.name
+            for entry in entries
+            if pattern.match(entry.name) and entry.is_file()
+        ]
 
 
 def _resolve_symlinks(files: List[pathlib.Path]) -> List[pathlib.Path]:
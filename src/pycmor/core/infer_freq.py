@@ -24,6 +24,33 @@ FrequencyResult = namedtuple(
     ],
 )
 
+_DAYS_IN_CALENDAR_YEAR = {
+    "standard": 365.25,
+    "gregorian": 365.25,
+    "noleap": 365.0,
+    "360_day": 360.0,
+}
+"""dict: Average year length in days for the calendars with a known length."""
+
+
+def _base_freqs(days_in_calendar_year):
+    """Base frequency lengths in days, for a year of the given length."""
+    return {
+        "H": 1 / 24,
+        "D": 1,
+        "W": 7,
+        "M": days_in_calendar_year / 12,
+        "Q": days_in_calendar_year / 4,
+        "A": days_in_calendar_year,
+        "10A": days_in_calendar_year * 10,
+    }
+
+
+_BASE_FREQS = {
+    calendar: _base_freqs(days) for calendar, days in _DAYS_IN_CALENDAR_YEAR.items()
+}
+"""dict: Base frequency lengths in days, per calendar, built once at import."""
+
 
 def _convert_cftime_to_ordinals(times_values):
     """Convert cftime objects to ordinal values."""
@@ -160,22 +187,8 @@ def _infer_frequency_core(
     median_delta = np.median(deltas)
     std_delta = np.std(deltas)
 
-    days_in_calendar_year = {
-        "standard": 365.25,
-        "gregorian": 365.25,
-        "noleap": 365.0,
-        "360_day": 360.0,
-    }.get(calendar, 365.25)
-
-    base_freqs = {
-        "H": 1 / 24,
-        "D": 1,
-        "W": 7,
-        "M": days_in_calendar_year / 12,
-        "Q": days_in_calendar_year / 4,
-        "A": days_in_calendar_year,
-        "10A": days_in_calendar_year * 10,
-    }
+    # Unknown calendars are treated like the standard one
+    base_freqs = _BASE_FREQS.get(calendar, _BASE_FREQS["standard"])
 
     matched_freq = None
     matched_step = None
@@ -221,7 +234,13 @@ def _infer_frequency_core(
             base_freqs[matched_freq] * matched_step
         )
         actual_steps = len(times) - 1
-        if not np.all(np.abs(deltas - median_delta) <= tol * median_delta):
+        # NOTE(PG): The largest deviation from the median is at one of the two
+        #           extremes, so compare those instead of building |deltas - median|.
+        allowed_deviation = tol * median_delta
+        if not (
+            deltas.max() - median_delta <= allowed_deviation
+            and median_delta - deltas.min() <= allowed_deviation
+        ):
             status = "irregular"
             is_exact = False  # Fix: Update is_exact to be consistent
         if abs(expected_steps - actual_steps) >= 1:
@@ -577,6 +596,9 @@ def is_resolution_fine_enough(
 
 @register_dataarray_accessor("timefreq")
 class TimeFrequencyAccessor:
+    # NOTE: one accessor is created per DataArray, so skip the per-instance __dict__
+    __slots__ = ("_obj",)
+
     def __init__(self, xarray_obj):
         self._obj = xarray_obj
 
@@ -841,6 +863,8 @@ class TimeFrequencyAccessor:
 
 @register_dataset_accessor("timefreq")
 class DatasetFrequencyAccessor:
+    __slots__ = ("_ds",)
+
     def __init__(self, ds):
         self._ds = ds
 
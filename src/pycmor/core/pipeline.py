@@ -2,7 +2,6 @@
 Pipeline of the data processing steps.
 """
 
-import copy
 from datetime import timedelta
 
 import randomname
@@ -91,7 +90,9 @@ class Pipeline:
 
     def _prefectize_steps(self):
         # Turn all steps into Prefect tasks:
-        raw_steps = copy.deepcopy(self._steps)
+        # NOTE: a shallow copy is enough, the steps themselves are never modified
+        #       (and deepcopy hands plain functions back unchanged anyway).
+        raw_steps = list(self._steps)
         prefect_tasks = []
         for i, step in enumerate(self._steps):
             logger.debug(
@@ -149,12 +149,15 @@ class Rule:
             logger.debug("Pipelines already mapped, nothing to do")
             return self.pipelines
         known_pipelines = {p.name: p for p in pipelines}
+        # NOTE(PG): This runs for every rule, so pass the arguments to the logger
+        #           rather than formatting them; loguru only does that when the
+        #           message is actually emitted.
         logger.debug("The following pipelines are known:")
         for pl_name, pl in known_pipelines.items():
-            logger.debug(f"{pl_name}: {pl}")
+            logger.debug("{}: {}", pl_name, pl)
         matched_pipelines = list()
         for pl in self.pipelines:
-            logger.debug(f"Working on: {pl}")
+            logger.debug("Working on: {}", pl)
             # Pipeline was already matched
             if isinstance(pl, pipeline.Pipeline):
                 matched_pipelines.append(pl)
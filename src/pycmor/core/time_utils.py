@@ -7,6 +7,8 @@ This module provides utilities for:
 - Checking for time axes in datasets
 """
 
+from itertools import chain
+
 import cftime
 import numpy as np
 import xarray as xr
@@ -14,7 +16,8 @@ import xarray as xr
 
 def is_cftime_type(arr: np.ndarray) -> bool:
     """Checks if array elements are cftime objects"""
-    if arr.size == 0:
+    # Only object arrays can hold cftime dates, no need to read an element otherwise
+    if arr.size == 0 or arr.dtype != object:
         return False
 
     # Check if the first element is a cftime object
@@ -28,7 +31,7 @@ def is_cftime_type(arr: np.ndarray) -> bool:
 
 def is_datetime_type(arr: np.ndarray) -> bool:
     """Checks if array elements are datetime objects or cftime objects"""
-    return is_cftime_type(arr) or np.issubdtype(arr.dtype, np.datetime64)
+    return np.issubdtype(arr.dtype, np.datetime64) or is_cftime_type(arr)
 
 
 def get_time_label(ds):
@@ -67,8 +70,11 @@ def get_time_label(ds):
     """
     # Find all datetime coordinates that have dimensions
     datetime_coords = []
-    for name, coord in ds.coords.items():
-        if is_datetime_type(coord) and coord.dims and name in coord.dims:
+    # NOTE(PG): Iterating over the coordinate variables avoids building a DataArray
+    #           per coordinate, and the cheap dimension check goes before looking
+    #           at the (possibly lazy) values.
+    for name, coord in ds.coords.variables.items():
+        if name in coord.dims and is_datetime_type(coord):
             datetime_coords.append(name)
 
     if not datetime_coords:
@@ -83,9 +89,9 @@ def get_time_label(ds):
     unused_coords = []
 
     # Get all dimensions used by data variables
-    used_dims = set()
-    for data_var in ds.data_vars.values():
-        used_dims.update(data_var.dims)
+    used_dims = set(
+        chain.from_iterable(data_var.dims for data_var in ds.data_vars.values())
+    )
 
     # Separate datetime coordinates into used and unused
     for coord_name in datetime_coords:
@@ -6,8 +6,11 @@ import importlib
 import inspect
 import os
 import tempfile
+import threading
 import time
-from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache, partial
 
 import pkg_resources
 import requests
@@ -74,6 +77,10 @@ def get_callable_by_name(name):
     return getattr(module, callable_name)
 
 
+# NOTE(PG): Scanning the installed distributions for entry points is slow, and
+#           every pipeline resolves the same step names again, so remember the
+#           loaded objects. Misses still raise and are therefore not cached.
+@lru_cache(maxsize=256)
 def get_entrypoint_by_name(name, group="pycmor.steps"):
     """
     Get an entry point by its name.
@@ -183,14 +190,13 @@ def can_be_partialized(
         True if the function can be partially applied with a single argument open, False otherwise.
     """
     signature = inspect.signature(func)
-    param_names = list(signature.parameters.keys())
-    # Check that all arguments in arg_list are in the function signature
-    for arg in arg_list:
-        if arg in param_names:
-            param_names.remove(arg)
-    for kwarg in kwargs_dict:
-        if kwarg in param_names:
-            param_names.remove(kwarg)
+    # Keep the parameters not covered by arg_list or kwargs_dict. One pass with
+    # dict lookups for the keywords, rather than a list.remove() scan per name.
+    param_names = [
+        name
+        for name in signature.parameters
+        if name not in kwargs_dict and name not in arg_list
+    ]
     # Check that there is only one argument left and that it is open_arg
     return len(param_names) == 1 and param_names[0] == open_arg
 
@@ -320,10 +326,58 @@ def list_files_in_directory(git_url, directory_path, branch="main"):
         )
 
 
+MAX_DOWNLOAD_WORKERS = 8
+"""int: Maximum number of files downloaded concurrently."""
+
+
+@contextmanager
+def thread_local_sessions():
+    """
+    Provides one ``requests.Session`` per thread, for use in a thread pool.
+
+    A session is not safe to share between threads, but a fresh one per request
+    would lose connection reuse. Each worker therefore gets its own session on
+    first use, and keeps reusing it for the requests it handles.
+
+    Yields
+    ------
+    callable
+        Returns the session of the calling thread. All sessions created through
+        it are closed when the context exits.
+    """
+    local = threading.local()
+    sessions = []
+
+    def get_session():
+        session = getattr(local, "session", None)
+        if session is None:
+            session = local.session = requests.Session()
+            sessions.append(session)
+        return session
+
+    try:
+        yield get_session
+    finally:
+        for session in sessions:
+            session.close()
+
+
+def _download_json_table(get_session, url: str, directory: str, filename: str):
+    response = get_session().get(f"{url}/{filename}")
+    response.raise_for_status()
+    # Write the raw bytes, there is no need to decode and re-encode the text:
+    with open(os.path.join(directory, filename), "wb") as file:
+        file.write(response.content)
+        logger.debug(f"Loaded file {filename}")
+
+
 def download_json_tables_from_url(url: str, filenames: list):
     """
     Downloads JSON tables from a raw git URL
 
+    The downloads are network bound, so they are run concurrently in a thread pool.
+    Each worker thread uses its own session, so connections to the host are reused.
+
     Parameters
     ----------
     url : str
@@ -336,10 +390,9 @@ def download_json_tables_from_url(url: str, filenames: list):
     """
     directory = tempfile.mkdtemp()
     logger.debug(f"Downloading JSON tables from '{url}' to '{directory}'")
-    for filename in filenames:
-        response = requests.get(f"{url}/{filename}")
-        response.raise_for_status()
-        with open(os.path.join(directory, filename), "w") as file:
-            file.write(response.text)
-            logger.debug(f"Loaded file {filename}")
+    with thread_local_sessions() as get_session:
+        download = partial(_download_json_table, get_session, url, directory)
+        with ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS) as executor:
+            # Consuming the results re-raises the first failed download, if any
+            list(executor.map(download, filenames))
     return directory
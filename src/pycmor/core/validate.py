@@ -66,8 +66,7 @@ class PipelineSectionValidator(Validator):
                 if not pathlib.Path(script_path).expanduser().resolve().is_file():
                     self._error(field, "Must be a valid file path")
             else:
-                parts = value.split(".")
-                module_name, attr_name = ".".join(parts[:-1]), parts[-1]
+                module_name, _, attr_name = value.rpartition(".")
                 try:
                     module = importlib.import_module(module_name)
                     if not hasattr(module, attr_name):
@@ -2,15 +2,19 @@ import json
 import pathlib
 from abc import abstractmethod
 from enum import Enum
-from importlib.resources import files
 from typing import Dict
 
 import deprecation
 
 from ..core.factory import MetaFactory
 from ..core.utils import download_json_tables_from_url, list_files_in_directory
-from .table import CMIP6DataRequestTable, CMIP7DataRequestTable, DataRequestTable
-from .variable import CMIP7DataRequestVariable
+from .table import (
+    CMIP6_IGNORE_TABLE_FILES,
+    CMIP6DataRequestTable,
+    CMIP7DataRequestTable,
+    DataRequestTable,
+)
+from .variable import CMIP7DataRequestVariable, load_vendored_all_var_info
 
 
 class DataRequest(metaclass=MetaFactory):
@@ -62,29 +66,22 @@ class CMIP7DataRequest(DataRequest):
 
     @classmethod
     def from_vendored_json(cls):
-        _all_var_info = files("pycmor.data.cmip7").joinpath("all_var_info.json")
-        all_var_info = json.load(open(_all_var_info, "r"))
-        return cls.from_all_var_info(all_var_info)
+        return cls.from_all_var_info(load_vendored_all_var_info())
 
     @classmethod
     def from_all_var_info(cls, data):
-        tables = {}
-        variables = {}
-        table_ids = set(k.split(".")[0] for k in data["Compound Name"].keys())
-        for table_id in table_ids:
-            table = CMIP7DataRequestTable.from_all_var_info(table_id, data)
-            tables[table_id] = table
-            for variable in table.variables:
-                variable.table_header = table.header
-                variables[variable.variable_id] = variable
-        return cls(tables, variables)
+        return cls.from_tables(CMIP7DataRequestTable.table_dict_from_all_var_info(data))
 
     @classmethod
     def from_tables(cls, tables: Dict[str, DataRequestTable]) -> "CMIP7DataRequest":
+        variables = {}
         for table in tables.values():
             if not isinstance(table, DataRequestTable):
                 raise ValueError("All tables must be instances of DataRequestTable.")
-        return cls(tables)
+            for variable in table.variables:
+                variable.table_header = table.header
+                variables[variable.variable_id] = variable
+        return cls(tables, variables)
 
     @classmethod
     def from_directory(cls, directory: str) -> "CMIP7DataRequest":
@@ -92,7 +89,8 @@ class CMIP7DataRequest(DataRequest):
         directory = pathlib.Path(directory)
         for file in directory.iterdir():
             # We assume that the directory contains only 1 JSON file, the "all_vars_info" file
-            if file.is_file() and file.suffix == ".json":
+            # NOTE: check the suffix first, it is free, whereas is_file() needs a stat call
+            if file.suffix == ".json" and file.is_file():
                 return cls.from_json_file(file)
 
     @classmethod
@@ -106,16 +104,6 @@ class CMIP6DataRequest(DataRequest):
     GIT_URL = "https://github.com/PCMDI/cmip6-cmor-tables/"
     """str: The URL of the CMIP6 data request repository."""
 
-    _IGNORE_TABLE_FILES = [
-        "CMIP6_CV_test.json",
-        "CMIP6_coordinate.json",
-        "CMIP6_CV.json",
-        "CMIP6_formula_terms.json",
-        "CMIP6_grids.json",
-        "CMIP6_input_example.json",
-    ]
-    """List[str]: Table files to ignore when reading from a directory."""
-
     def __init__(
         self,
         tables: Dict[str, CMIP6DataRequestTable],
@@ -159,9 +147,10 @@ class CMIP6DataRequest(DataRequest):
         tables = {}
         directory = pathlib.Path(directory)
         for file in directory.iterdir():
-            if file.is_file() and file.suffix == ".json":
-                if file.name in cls._IGNORE_TABLE_FILES:
-                    continue
+            # NOTE: name checks are free, only stat the files we would actually read
+            if file.name in CMIP6_IGNORE_TABLE_FILES:
+                continue
+            if file.suffix == ".json" and file.is_file():
                 table = CMIP6DataRequestTable.from_json_file(file)
                 tables[table.table_id] = table
 
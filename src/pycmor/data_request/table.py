@@ -2,7 +2,6 @@ import json
 import pathlib
 from abc import abstractmethod
 from dataclasses import dataclass
-from importlib.resources import files
 from typing import List
 
 import pendulum
@@ -14,8 +13,22 @@ from .variable import (
     CMIP6DataRequestVariable,
     CMIP7DataRequestVariable,
     DataRequestVariable,
+    load_json_table,
+    load_vendored_all_var_info,
 )
 
+CMIP6_IGNORE_TABLE_FILES = frozenset(
+    {
+        "CMIP6_CV_test.json",
+        "CMIP6_coordinate.json",
+        "CMIP6_CV.json",
+        "CMIP6_formula_terms.json",
+        "CMIP6_grids.json",
+        "CMIP6_input_example.json",
+    }
+)
+"""frozenset: Files in a CMIP6 table directory that are not tables, and are skipped."""
+
 ################################################################################
 # BLUEPRINTS: Abstract classes for the data request tables
 ################################################################################
@@ -47,6 +60,21 @@ class DataRequestTable(metaclass=MetaFactory):
         """Retrieve a variable's details by name."""
         raise NotImplementedError
 
+    def _variable_index(self, find_by: str) -> dict:
+        """
+        Maps the values of the attribute ``find_by`` to the variables of this table.
+
+        The index is built on first use for each attribute, keeping the first
+        variable for duplicated values, and reused for all further lookups.
+        """
+        index = self._variable_indices.get(find_by)
+        if index is None:
+            index = {}
+            for v in self._variables:
+                index.setdefault(getattr(v, find_by), v)
+            self._variable_indices[find_by] = index
+        return index
+
     @property
     @abstractmethod
     def header(self) -> "DataRequestTableHeader":
@@ -242,24 +270,26 @@ class CMIP7DataRequestTableHeader(DataRequestTableHeader):
         cls, table_name: str, all_var_info: dict = None
     ) -> "CMIP7DataRequestTableHeader":
         if all_var_info is None:
-            _all_var_info = files("pycmor.data.cmip7").joinpath("all_var_info.json")
-            all_var_info = json.load(open(_all_var_info, "r"))
+            all_var_info = load_vendored_all_var_info()
+        # NOTE: include the separator in the prefix; matching on the table name alone
+        #       would also pick up e.g. EmonZ variables for the Emon table.
+        prefix = f"{table_name}."
         all_vars_for_table = {
             k: v
             for k, v in all_var_info["Compound Name"].items()
-            if k.startswith(table_name)
+            if k.startswith(prefix)
         }
+        # NOTE: collect the unique frequencies first, so each one is only
+        #       converted to an approx_interval once, rather than once per variable
+        frequencies = {var["frequency"] for var in all_vars_for_table.values()}
         attrs_for_table = {
-            "realm": set(),
-            "approx_interval": set(),
+            "realm": {var["modeling_realm"] for var in all_vars_for_table.values()},
+            "approx_interval": {
+                cls._approx_interval_from_frequency(frequency)
+                for frequency in frequencies
+            },
         }
 
-        for var in all_vars_for_table.values():
-            attrs_for_table["realm"].add(var["modeling_realm"])
-            attrs_for_table["approx_interval"].add(
-                cls._approx_interval_from_frequency(var["frequency"])
-            )
-
         # We assume that all variables in the table have the same approx_interval
         # If not, we need to raise an error
         if len(attrs_for_table["approx_interval"]) != 1:
@@ -441,10 +471,9 @@ class CMIP6DataRequestTableHeader(DataRequestTableHeader):
 class CMIP6JSONDataRequestTableHeader(CMIP6DataRequestTableHeader):
     @classmethod
     def from_json_file(cls, jfile) -> "CMIP6JSONDataRequestTableHeader":
-        with open(jfile, "r") as f:
-            data = json.load(f)
-            header = data["Header"]
-            return cls.from_dict(header)
+        data = load_json_table(jfile)
+        header = data["Header"]
+        return cls.from_dict(header)
 
 
 ################################################################################
@@ -461,6 +490,7 @@ class CMIP6DataRequestTable(DataRequestTable):
     ):
         self._header = header
         self._variables = variables
+        self._variable_indices = {}
 
     @property
     def variables(self) -> List[str]:
@@ -485,12 +515,12 @@ class CMIP6DataRequestTable(DataRequestTable):
         -------
         DataRequestVariable
         """
-        for v in self._variables:
-            if getattr(v, find_by) == name:
-                return v
-        raise ValueError(
-            f"A Variable with the attribute {find_by}={name} not found in the table."
-        )
+        variable = self._variable_index(find_by).get(name)
+        if variable is None:
+            raise ValueError(
+                f"A Variable with the attribute {find_by}={name} not found in the table."
+            )
+        return variable
 
     @classmethod
     def from_dict(cls, data: dict) -> "CMIP6DataRequestTable":
@@ -503,30 +533,19 @@ class CMIP6DataRequestTable(DataRequestTable):
 
     @classmethod
     def table_dict_from_directory(cls, path) -> dict:
-        # We need to know which files to skip...
-        _skip_files = [
-            "CMIP6_CV_test.json",
-            "CMIP6_coordinate.json",
-            "CMIP6_CV.json",
-            "CMIP6_formula_terms.json",
-            "CMIP6_grids.json",
-            "CMIP6_input_example.json",
-        ]
         path = pathlib.Path(path)  # noop if already a Path
         tables = {}
         for file in path.iterdir():
-            if file.name in _skip_files:
+            if file.name in CMIP6_IGNORE_TABLE_FILES:
                 continue
-            if file.is_file() and file.suffix == ".json":
+            if file.suffix == ".json" and file.is_file():
                 table = cls.from_json_file(file)
                 tables[table.table_id] = table
         return tables
 
     @classmethod
     def from_json_file(cls, jfile) -> "CMIP6DataRequestTable":
-        with open(jfile, "r") as f:
-            data = json.load(f)
-        return cls.from_dict(data)
+        return cls.from_dict(load_json_table(jfile))
 
 
 ################################################################################
@@ -544,6 +563,7 @@ class CMIP7DataRequestTable(DataRequestTable):
     ):
         self._header = header
         self._variables = variables
+        self._variable_indices = {}
 
     @property
     def variables(self) -> List[str]:
@@ -568,12 +588,12 @@ class CMIP7DataRequestTable(DataRequestTable):
         -------
         DataRequestVariable
         """
-        for v in self._variables:
-            if getattr(v, find_by) == name:
-                return v
-        raise ValueError(
-            f"A Variable with the attribute {find_by}={name} not found in the table."
-        )
+        variable = self._variable_index(find_by).get(name)
+        if variable is None:
+            raise ValueError(
+                f"A Variable with the attribute {find_by}={name} not found in the table."
+            )
+        return variable
 
     @classmethod
     def from_dict(cls, data: dict) -> "CMIP7DataRequestTable":
@@ -588,15 +608,13 @@ class CMIP7DataRequestTable(DataRequestTable):
 
     @classmethod
     def from_all_var_info_json(cls, table_name: str) -> "CMIP7DataRequestTable":
-        _all_var_info = files("pycmor.data.cmip7").joinpath("all_var_info.json")
-        all_var_info = json.load(open(_all_var_info, "r"))
+        all_var_info = load_vendored_all_var_info()
         return cls.from_all_var_info(table_name, all_var_info)
 
     @classmethod
     def from_all_var_info(cls, table_name: str, all_var_info: dict = None):
         if all_var_info is None:
-            _all_var_info = files("pycmor.data.cmip7").joinpath("all_var_info.json")
-            all_var_info = json.load(open(_all_var_info, "r"))
+            all_var_info = load_vendored_all_var_info()
         header = CMIP7DataRequestTableHeader.from_all_var_info(table_name, all_var_info)
         variables = []
         for var_name, var_dict in all_var_info["Compound Name"].items():
@@ -607,7 +625,6 @@ class CMIP7DataRequestTable(DataRequestTable):
     @classmethod
     def table_dict_from_directory(cls, path) -> dict:
         path = pathlib.Path(path)  # noop if already a Path
-        tables = {}
         try:
             with open(path / "all_var_info.json", "r") as f:
                 all_var_info = json.load(f)
@@ -618,11 +635,37 @@ class CMIP7DataRequestTable(DataRequestTable):
             )
             logger.error("Sorry...")
             raise FileNotFoundError
-        table_ids = set(k.split(".")[0] for k in all_var_info["Compound Name"].keys())
-        for table_id in table_ids:
-            table = cls.from_all_var_info(table_id, all_var_info)
-            tables[table_id] = table
-        return tables
+        return cls.table_dict_from_all_var_info(all_var_info)
+
+    @classmethod
+    def table_dict_from_all_var_info(cls, all_var_info: dict) -> dict:
+        """
+        Builds every table contained in an ``all_var_info`` dictionary.
+
+        The variables are grouped by table in a single pass, so each table only
+        has to look at its own variables rather than at the whole data request.
+
+        Parameters
+        ----------
+        all_var_info : dict
+            The contents of an ``all_var_info.json`` file.
+
+        Returns
+        -------
+        dict
+            The tables, keyed by table id.
+        """
+        var_info_by_table = {}
+        for compound_name, var_dict in all_var_info["Compound Name"].items():
+            table_id = compound_name.partition(".")[0]
+            table_var_info = var_info_by_table.setdefault(
+                table_id, {"Compound Name": {}}
+            )
+            table_var_info["Compound Name"][compound_name] = var_dict
+        return {
+            table_id: cls.from_all_var_info(table_id, table_var_info)
+            for table_id, table_var_info in var_info_by_table.items()
+        }
 
     @classmethod
     def from_json_file(cls, jfile) -> "CMIP7DataRequestTable":
@@ -20,7 +20,10 @@ a ``DataRequestVariable`` instance to a dictionary representation.
 """
 
 import copy
+import functools
 import json
+import os
+import sys
 from abc import abstractmethod
 from dataclasses import dataclass
 from importlib.resources import files
@@ -28,6 +31,78 @@ from typing import Optional
 
 from ..core.factory import MetaFactory
 
+CMIP7_ALL_VAR_INFO = files("pycmor.data.cmip7").joinpath("all_var_info.json")
+"""Traversable: The vendored CMIP7 ``all_var_info.json`` file, resolved once at import."""
+
+_INTERNED_VAR_INFO_FIELDS = frozenset(
+    {
+        "frequency",
+        "modeling_realm",
+        "units",
+        "cell_methods",
+        "cell_measures",
+        "dimensions",
+        "type",
+        "positive",
+        "spatial_shape",
+        "temporal_shape",
+        "cmip6_cmor_table",
+    }
+)
+"""frozenset: Low-cardinality ``all_var_info.json`` fields whose values are interned."""
+
+
+def _intern_var_info_fields(obj: dict) -> dict:
+    """``object_hook`` for :func:`json.load` that interns low-cardinality string values."""
+    for key in _INTERNED_VAR_INFO_FIELDS.intersection(obj):
+        value = obj[key]
+        if isinstance(value, str):
+            obj[key] = sys.intern(value)
+    return obj
+
+
+@functools.lru_cache(maxsize=1)
+def load_vendored_all_var_info() -> dict:
+    """
+    Loads the vendored CMIP7 ``all_var_info.json``, parsing it only once per process.
+
+    The returned dictionary is shared between all callers and must not be modified
+    in place; copy any entry you need to change.
+    """
+    # NOTE(PG): The json module already shares repeated keys within one parse, but
+    # not values. Fields such as the frequency or the table only take a handful of
+    # distinct values across thousands of variables, so share those too.
+    with open(CMIP7_ALL_VAR_INFO, "r") as f:
+        return json.load(f, object_hook=_intern_var_info_fields)
+
+
+@functools.lru_cache(maxsize=64)
+def _load_json_table(path: str, mtime_ns: int) -> dict:
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def load_json_table(path) -> dict:
+    """
+    Loads a JSON table file, re-using the parsed content for files already read.
+
+    Parsed files are cached by path and modification time, so a file that changed
+    on disk is read again. The returned dictionary is shared between all callers
+    and must not be modified in place; copy any entry you need to change.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        Path to the JSON file.
+
+    Returns
+    -------
+    dict
+        The parsed content of the file.
+    """
+    path = os.fspath(path)
+    return _load_json_table(path, os.stat(path).st_mtime_ns)
+
 
 @dataclass
 class DataRequestVariable(metaclass=MetaFactory):
@@ -171,7 +246,7 @@ class DataRequestVariable(metaclass=MetaFactory):
     @property
     @abstractmethod
     def attrs(self) -> dict:
-        """Attributes to update the Xarray DataArray with"""
+        """Attributes to update the Xarray DataArray with, as a new dict on every access"""
         raise NotImplementedError
 
     #################################################################
@@ -390,20 +465,22 @@ class CMIP6DataRequestVariable(DataRequestVariable):
         return rdict
 
     def clone(self) -> "CMIP6DataRequestVariable":
-        clone = copy.deepcopy(self)
+        # NOTE(PG): All fields are immutable (strings, tuples, numbers, types), and the
+        #           table header is only ever read, so it can be shared between clones.
+        #           A shallow copy is therefore enough, and much cheaper than a deepcopy.
+        clone = copy.copy(self)
         return clone
 
 
 class CMIP6JSONDataRequestVariable(CMIP6DataRequestVariable):
     @classmethod
     def from_json_file(cls, jfile: str, varname: str) -> "CMIP6DataRequestVariable":
-        with open(jfile, "r") as f:
-            data = json.load(f)
-            header = data["Header"]
-            table_name = header["table_id"].replace("Table ", "")
-            var_data = data["variable_entry"][varname]
-            var_data["table_name"] = table_name
-            return cls.from_dict(var_data)
+        data = load_json_table(jfile)
+        header = data["Header"]
+        table_name = header["table_id"].replace("Table ", "")
+        var_data = dict(data["variable_entry"][varname])
+        var_data["table_name"] = table_name
+        return cls.from_dict(var_data)
 
 
 @dataclass
@@ -454,10 +531,10 @@ class CMIP7DataRequestVariable(DataRequestVariable):
 
     @classmethod
     def from_all_var_info_json(cls, var_name: str, table_name: str):
-        _all_var_info = files("pycmor.data.cmip7").joinpath("all_var_info.json")
-        all_var_info = json.load(open(_all_var_info, "r"))
+        all_var_info = load_vendored_all_var_info()
         key = f"{table_name}.{var_name}"
-        data = all_var_info["Compound Name"][key]
+        # NOTE: shallow copy, the cached entry is shared and must stay untouched
+        data = dict(all_var_info["Compound Name"][key])
         data["out_name"] = var_name
         data["cmip6_cmor_table"] = table_name
         return cls.from_dict(data)
@@ -546,5 +623,6 @@ class CMIP7DataRequestVariable(DataRequestVariable):
         raise NotImplementedError("Not yet figured out")
 
     def clone(self) -> "CMIP7DataRequestVariable":
-        clone = copy.deepcopy(self)
+        # NOTE(PG): Shallow on purpose, see CMIP6DataRequestVariable.clone
+        clone = copy.copy(self)
         return clone
@@ -14,6 +14,8 @@ import glob
 import json
 import os
 import re
+import shutil
+import tempfile
 
 import click
 import yaml
@@ -26,6 +28,9 @@ DIMENSIONLESS_PATTERNS = [
     r"\d+\s?%",  # Percentage
     r"0.001",  # Salinity scaling factor
 ]
+# One alternation matches all patterns in a single call, instead of one
+# re.match (and cache lookup) per pattern for every unit in every table
+_DIMENSIONLESS_RE = re.compile("|".join(f"(?:{p})" for p in DIMENSIONLESS_PATTERNS))
 
 # Special keywords to check in units
 SPECIAL_KEYWORDS = [
@@ -36,10 +41,7 @@ SPECIAL_KEYWORDS = [
 
 def is_dimensionless_unit(unit):
     """Check if a unit string represents a dimensionless quantity"""
-    for pattern in DIMENSIONLESS_PATTERNS:
-        if re.match(pattern, unit):
-            return True
-    return False
+    return _DIMENSIONLESS_RE.match(unit) is not None
 
 
 def extract_variables_from_tables(tables_path):
@@ -104,36 +106,52 @@ def update_yaml_file(yaml_path, variables):
         except Exception as e:
             logger.warning(f"Could not read existing yaml file: {e}")
 
-    # Create the new YAML content
-    yaml_content = (
-        "# In general:\n# model_variable_name:  # standard_name\n#   "
-        "cmor_unit_string: pint_friendly_SI_units\n\n"
+    # Write the new YAML content entry by entry, rather than building it up as
+    # one string first. It goes to a temporary file next to the target, which
+    # only replaces the original once it is complete, so an error part way
+    # through cannot leave the existing (hand curated) file half written.
+    tmp = tempfile.NamedTemporaryFile(
+        "w",
+        dir=os.path.dirname(os.path.abspath(yaml_path)),
+        prefix=".dimensionless_mappings.",
+        suffix=".tmp",
+        delete=False,
     )
-
-    # Process all variables
-    for var_name, var_info in sorted(variables.items()):
-        standard_name = var_info["standard_name"]
-        unit = var_info["unit"]
-
-        # Format the YAML entry
-        yaml_content += f"{var_name}:  # {standard_name}\n"
-
-        # Check if this variable exists in the current YAML
-        if var_name in existing_data and existing_data[var_name]:
-            # Preserve existing values from the YAML file
-            for unit_key, value in existing_data[var_name].items():
-                # If value is None or empty or the string "None", leave just a space
-                if value is None or value == "" or value == "None":
-                    yaml_content += f'  "{unit_key}": \n'
+    try:
+        with tmp as f:
+            f.write(
+                "# In general:\n# model_variable_name:  # standard_name\n#   "
+                "cmor_unit_string: pint_friendly_SI_units\n\n"
+            )
+
+            # Process all variables
+            for var_name, var_info in sorted(variables.items()):
+                standard_name = var_info["standard_name"]
+                unit = var_info["unit"]
+
+                # Format the YAML entry
+                f.write(f"{var_name}:  # {standard_name}\n")
+
+                # Check if this variable exists in the current YAML
+                if var_name in existing_data and existing_data[var_name]:
+                    # Preserve existing values from the YAML file
+                    for unit_key, value in existing_data[var_name].items():
+                        # If value is None or empty or the string "None", leave just a space
+                        if value is None or value == "" or value == "None":
+                            f.write(f'  "{unit_key}": \n')
+                        else:
+                            f.write(f'  "{unit_key}": {value}\n')
                 else:
-                    yaml_content += f'  "{unit_key}": {value}\n'
-        else:
-            # All new entries get an empty value (just a space)
-            yaml_content += f'  "{unit}": \n'
-
-    # Write the updated content to the file
-    with open(yaml_path, "w") as f:
-        f.write(yaml_content)
+                    # All new entries get an empty value (just a space)
+                    f.write(f'  "{unit}": \n')
+
+        # Keep the permissions of the file being replaced (temporary files are 0600)
+        if os.path.exists(yaml_path):
+            shutil.copymode(yaml_path, tmp.name)
+        os.replace(tmp.name, yaml_path)
+    except BaseException:
+        os.unlink(tmp.name)
+        raise
 
     logger.info(f"Updated {yaml_path} with {len(variables)} variables")
 
@@ -26,7 +26,7 @@ from xarray import DataArray, Dataset
 from ..core.logging import logger
 from ..core.rule import Rule
 from .bounds import add_vertical_bounds as _add_vertical_bounds
-from .dataset_helpers import freq_is_coarser_than_data, get_time_label, has_time_axis
+from .dataset_helpers import freq_is_coarser_than_data, get_time_label
 from .exceptions import (
     PycmorResamplingError,
     PycmorResamplingTimeAxisIncompatibilityError,
@@ -195,10 +195,10 @@ def temporal_resample(
     --------
     https://docs.xarray.dev/en/stable/user-guide/time-series.html#resampling-and-grouped-operations
     """
-    if not has_time_axis(data):
+    time_dim = get_time_label(data)
+    if not time_dim:
         return data
 
-    time_dim = get_time_label(data)
     freq = rule.data_request_variable.frequency
     if not freq_is_coarser_than_data(freq, data):
         raise PycmorResamplingTimeAxisIncompatibilityError(
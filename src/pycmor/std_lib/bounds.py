@@ -5,17 +5,60 @@ This module provides functionality to automatically calculate coordinate bounds
 when they are not present in the dataset. Bounds are required for CMIP compliance
 and represent the edges of grid cells.
 
-The main function is :func:`add_bounds_from_coords` which uses cf_xarray to
-infer bounds from coordinate values.
+The main function is :func:`add_bounds_from_coords` which infers bounds from
+coordinate values.
 """
 
-import cf_xarray as cfxr  # noqa: F401
 import numpy as np
 import xarray as xr
 
 from ..core.logging import logger
 
 
+def _bounds_np(values: np.ndarray) -> np.ndarray:
+    """
+    Calculate the ``(n, 2)`` bounds of a 1D NumPy array of coordinate values.
+
+    This is the NumPy core of :func:`calculate_bounds_1d`, see there for details.
+    """
+    n = len(values)
+    # Floating point coordinates keep their precision (float32 grids stay float32),
+    # anything else is promoted to floating point.
+    dtype = np.result_type(values.dtype, np.float32)
+    # Do the arithmetic in that dtype too, so small integer types cannot overflow
+    # (this is a no-op for floating point input)
+    values = values.astype(dtype, copy=False)
+
+    # NOTE(PG): The n + 1 cell edges are calculated in a contiguous array first,
+    #           the arithmetic on the strided columns of an (n, 2) array is slower.
+    #           Every element is written below, so there is no need to zero-fill.
+    edges = np.empty(n + 1, dtype=dtype)
+
+    if n == 1:
+        # Special case: single point
+        # Assume a cell width equal to 1 unit (arbitrary but reasonable)
+        edges[0] = values[0] - 0.5
+        edges[1] = values[0] + 0.5
+    else:
+        # General case: two or more points
+        # Calculate midpoints between adjacent values, directly into the inner edges
+        midpoints = edges[1:-1]
+        np.add(values[:-1], values[1:], out=midpoints)
+        midpoints *= 0.5
+
+        # Extrapolate for first point using spacing to next midpoint
+        edges[0] = values[0] - (midpoints[0] - values[0])
+
+        # Extrapolate for last point using spacing from previous midpoint
+        edges[-1] = values[-1] + (values[-1] - midpoints[-1])
+
+    # Lower bounds are the edges before each point, upper bounds the edges after it
+    bounds = np.empty((n, 2), dtype=dtype)
+    bounds[:, 0] = edges[:-1]
+    bounds[:, 1] = edges[1:]
+    return bounds
+
+
 def calculate_bounds_1d(coord: xr.DataArray) -> xr.DataArray:
     """
     Calculate bounds for a 1D coordinate array.
@@ -24,6 +67,9 @@ def calculate_bounds_1d(coord: xr.DataArray) -> xr.DataArray:
     midpoints between adjacent coordinate values. For the first and last
     points, it extrapolates using the same spacing.
 
+    Dask-backed coordinates are not loaded into memory, their bounds are
+    computed lazily instead.
+
     Parameters
     ----------
     coord : xr.DataArray
@@ -34,6 +80,8 @@ def calculate_bounds_1d(coord: xr.DataArray) -> xr.DataArray:
     xr.DataArray
         Bounds array with shape (n, 2) where n is the length of coord.
         bounds[i, 0] is the lower bound and bounds[i, 1] is the upper bound.
+        Floating point coordinates keep their dtype (e.g. float32), integer
+        coordinates get floating point bounds.
 
     Examples
     --------
@@ -44,49 +92,29 @@ def calculate_bounds_1d(coord: xr.DataArray) -> xr.DataArray:
      [15. 25.]
      [25. 35.]]
     """
-    values = coord.values
-    n = len(values)
-
-    # Create bounds array
-    bounds = np.zeros((n, 2))
-
-    if n == 1:
-        # Special case: single point
-        # Assume a cell width equal to 1 unit (arbitrary but reasonable)
-        bounds[0, 0] = values[0] - 0.5
-        bounds[0, 1] = values[0] + 0.5
-    elif n == 2:
-        # Special case: two points
-        # Use the spacing between them
-        spacing = values[1] - values[0]
-        bounds[0, 0] = values[0] - spacing / 2
-        bounds[0, 1] = values[0] + spacing / 2
-        bounds[1, 0] = values[1] - spacing / 2
-        bounds[1, 1] = values[1] + spacing / 2
+    dim_name = coord.dims[0]
+    if coord.chunks is not None:
+        # NOTE(PG): Accessing coord.values would compute the whole coordinate.
+        # Neighbouring values are needed for the midpoints, so the coordinate is
+        # put into a single chunk along its dimension and handed to dask as is.
+        bounds = xr.apply_ufunc(
+            _bounds_np,
+            coord.chunk({dim_name: -1}),
+            input_core_dims=[[dim_name]],
+            output_core_dims=[[dim_name, "bnds"]],
+            dask="parallelized",
+            output_dtypes=[np.result_type(coord.dtype, np.float32)],
+            dask_gufunc_kwargs={"output_sizes": {"bnds": 2}},
+        ).data
     else:
-        # General case: three or more points
-        # Calculate midpoints between adjacent values
-        midpoints = (values[:-1] + values[1:]) / 2.0
-
-        # Interior points: use midpoints
-        bounds[1:, 0] = midpoints  # Lower bounds
-        bounds[:-1, 1] = midpoints  # Upper bounds
+        bounds = _bounds_np(coord.values)
 
-        # Extrapolate for first point using spacing to next midpoint
-        bounds[0, 0] = values[0] - (midpoints[0] - values[0])
-
-        # Extrapolate for last point using spacing from previous midpoint
-        bounds[-1, 1] = values[-1] + (values[-1] - midpoints[-1])
+    # Name the bounds after the coordinate, if there is anything to name them after
+    long_name = coord.attrs.get("long_name") or coord.name
+    attrs = {"long_name": f"{long_name} bounds"} if long_name else {}
 
     # Create DataArray with appropriate dimensions
-    dim_name = coord.dims[0]
-    bounds_da = xr.DataArray(
-        bounds,
-        dims=[dim_name, "bnds"],
-        attrs={
-            "long_name": f"{coord.attrs.get('long_name', coord.name)} bounds",
-        },
-    )
+    bounds_da = xr.DataArray(bounds, dims=[dim_name, "bnds"], attrs=attrs)
 
     return bounds_da
 
@@ -128,6 +156,23 @@ def calculate_bounds_2d(
     return None
 
 
+def _assign_bounds(ds: xr.Dataset, new_bounds: dict) -> xr.Dataset:
+    """
+    Add calculated bounds to a dataset in one go, and point each coordinate to them.
+
+    ``new_bounds`` maps coordinate names to their bounds. If it is empty, ``ds`` is
+    returned as is, rather than as an unmodified copy.
+    """
+    if not new_bounds:
+        return ds
+    ds_out = ds.assign(
+        {f"{coord_name}_bnds": bounds for coord_name, bounds in new_bounds.items()}
+    )
+    for coord_name in new_bounds:
+        ds_out[coord_name].attrs["bounds"] = f"{coord_name}_bnds"
+    return ds_out
+
+
 def add_bounds_from_coords(
     ds: xr.Dataset,
     coord_names: list[str] = None,
@@ -137,8 +182,8 @@ def add_bounds_from_coords(
     Add coordinate bounds to a dataset by calculating them from coordinate values.
 
     This function automatically calculates and adds bounds for specified coordinates
-    (or lat/lon by default) if they don't already exist. It uses cf_xarray to
-    identify coordinates and calculates bounds based on coordinate values.
+    (or lat/lon by default) if they don't already exist. Bounds are calculated
+    based on coordinate values.
 
     Parameters
     ----------
@@ -170,41 +215,44 @@ def add_bounds_from_coords(
     if coord_names is None:
         coord_names = ["lat", "lon", "latitude", "longitude"]
 
-    ds_out = ds.copy()
+    new_bounds = {}
+    # NOTE(PG): ds.variables holds both coordinates and data variables, so one
+    # lookup there replaces checking ds.coords and ds.data_vars separately
+    variables = ds.variables
 
-    for coord_name in coord_names:
+    # Duplicate names (e.g. from a user supplied list) only need to be handled once
+    for coord_name in dict.fromkeys(coord_names):
         # Check if coordinate exists in dataset
-        if coord_name not in ds.coords and coord_name not in ds.data_vars:
+        if coord_name not in variables:
             continue
 
         coord = ds[coord_name]
         bounds_name = f"{coord_name}_bnds"
 
         # Skip if bounds already exist
-        if bounds_name in ds.data_vars or bounds_name in ds.coords:
+        # NOTE(PG): loguru only formats arguments passed separately if the message
+        #           is actually emitted, unlike f-strings, which are always built.
+        if bounds_name in variables:
             logger.debug(
-                f"  → Bounds '{bounds_name}' already exist, skipping calculation"
+                "  → Bounds '{}' already exist, skipping calculation", bounds_name
             )
             continue
 
         # Calculate bounds based on dimensionality
         if coord.ndim == 1:
-            logger.info(f"  → Calculating 1D bounds for '{coord_name}'")
+            logger.info("  → Calculating 1D bounds for '{}'", coord_name)
             bounds = calculate_bounds_1d(coord)
 
             if bounds is not None:
-                ds_out[bounds_name] = bounds
-                # Add bounds attribute to coordinate
-                ds_out[coord_name].attrs["bounds"] = bounds_name
-                logger.info(f"  → Added bounds variable '{bounds_name}'")
+                new_bounds[coord_name] = bounds
+                logger.info("  → Added bounds variable '{}'", bounds_name)
         elif coord.ndim == 2:
-            logger.info(f"  → Attempting 2D bounds calculation for '{coord_name}'")
+            logger.info("  → Attempting 2D bounds calculation for '{}'", coord_name)
             bounds = calculate_bounds_2d(coord)
 
             if bounds is not None:
-                ds_out[bounds_name] = bounds
-                ds_out[coord_name].attrs["bounds"] = bounds_name
-                logger.info(f"  → Added bounds variable '{bounds_name}'")
+                new_bounds[coord_name] = bounds
+                logger.info("  → Added bounds variable '{}'", bounds_name)
             else:
                 logger.warning(
                     f"  → Could not calculate bounds for 2D coordinate '{coord_name}'. "
@@ -216,7 +264,7 @@ def add_bounds_from_coords(
                 "Bounds calculation only supports 1D and 2D coordinates."
             )
 
-    return ds_out
+    return _assign_bounds(ds, new_bounds)
 
 
 def add_vertical_bounds(
@@ -282,40 +330,40 @@ def add_vertical_bounds(
             "altitude",
         ]
 
-    ds_out = ds.copy()
+    new_bounds = {}
+    variables = ds.variables
 
-    for coord_name in vertical_coord_names:
+    for coord_name in dict.fromkeys(vertical_coord_names):
         # Check if coordinate exists in dataset
-        if coord_name not in ds.coords and coord_name not in ds.data_vars:
+        if coord_name not in variables:
             continue
 
         coord = ds[coord_name]
         bounds_name = f"{coord_name}_bnds"
 
         # Skip if bounds already exist
-        if bounds_name in ds.data_vars or bounds_name in ds.coords:
+        if bounds_name in variables:
             logger.debug(
-                f"  → Vertical bounds '{bounds_name}' already exist, skipping calculation"
+                "  → Vertical bounds '{}' already exist, skipping calculation",
+                bounds_name,
             )
             continue
 
         # Only handle 1D vertical coordinates
         if coord.ndim == 1:
-            logger.info(f"  → Calculating vertical bounds for '{coord_name}'")
+            logger.info("  → Calculating vertical bounds for '{}'", coord_name)
             bounds = calculate_bounds_1d(coord)
 
             if bounds is not None:
-                ds_out[bounds_name] = bounds
-                # Add bounds attribute to coordinate
-                ds_out[coord_name].attrs["bounds"] = bounds_name
-                logger.info(f"  → Added vertical bounds variable '{bounds_name}'")
+                new_bounds[coord_name] = bounds
+                logger.info("  → Added vertical bounds variable '{}'", bounds_name)
         else:
             logger.warning(
                 f"  → Vertical coordinate '{coord_name}' has {coord.ndim} dimensions. "
                 "Bounds calculation only supports 1D coordinates."
             )
 
-    return ds_out
+    return _assign_bounds(ds, new_bounds)
 
 
 def add_bounds_to_grid(grid: xr.Dataset) -> xr.Dataset:
@@ -9,9 +9,13 @@ from xarray.core.utils import is_scalar
 
 def is_datetime_type(arr: np.ndarray) -> bool:
     "Checks if array elements are datetime objects or cftime objects"
-    return isinstance(
+    # NOTE(PG): Decide by dtype where possible. Only object arrays can hold cftime
+    #           dates, and reading an element of a lazy array would load it.
+    if np.issubdtype(arr.dtype, np.datetime64):
+        return True
+    return arr.dtype == object and isinstance(
         arr.item(0), tuple(cftime._cftime.DATE_TYPES.values())
-    ) or np.issubdtype(arr, np.datetime64)
+    )
 
 
 def get_time_label(ds):
@@ -46,11 +50,11 @@ def get_time_label(ds):
     True
     """
     label = deque()
-    for name, coord in ds.coords.items():
-        if not is_datetime_type(coord):
-            continue
+    for name, coord in ds.coords.variables.items():
         if not coord.dims:
             continue
+        if not is_datetime_type(coord):
+            continue
         if name in coord.dims:
             label.appendleft(name)
         else:
@@ -38,10 +38,12 @@ Table 2: Precision of time labels used in file names
 
 """
 
+import re
 from pathlib import Path
 
 import pandas as pd
 import xarray as xr
+from xarray.coding.times import encode_cf_datetime
 from xarray.core.utils import is_scalar
 
 from ..core.logging import logger
@@ -65,9 +67,11 @@ def _filename_time_range(ds, rule) -> str:
     str
         time_range in filepath.
     """
-    if not has_time_axis(ds):
-        return ""
+    # NOTE(PG): has_time_axis is just get_time_label under the hood, so search
+    #           for the time coordinate once and check the result instead.
     time_label = get_time_label(ds)
+    if not time_label:
+        return ""
     if is_scalar(ds[time_label]):
         return ""
     start = pd.Timestamp(str(ds[time_label].data[0]))
@@ -112,8 +116,6 @@ def _sanitize_component(component):
     str
         The sanitized component
     """
-    import re
-
     # Convert component to string if it's not already (handles Mock objects)
     if not isinstance(component, str):
         component = str(component)
@@ -143,8 +145,6 @@ def _check_climatology_suffix(ds):
     str
         "-clim" if climatology, empty string otherwise
     """
-    if not has_time_axis(ds):
-        return ""
     time_label = get_time_label(ds)
     if time_label and "climatology" in ds[time_label].attrs:
         return "-clim"
@@ -324,19 +324,35 @@ def _save_dataset_with_native_timespan(
     paths = []
     datasets = split_data_timespan(da, rule)
 
+    # NOTE(PG): All datasets get the same time encoding, so decide once what needs
+    #           to be done, rather than once per output file.
+    # Set time units and calendar as attributes for consistency
+    # Only set if they are actual strings (not Mock objects)
+    # But avoid setting calendar attribute if it conflicts with encoding
+    time_units = time_encoding.get("units")
+    if not isinstance(time_units, str):
+        time_units = None
+    time_calendar = time_encoding.get("calendar")
+    if not isinstance(time_calendar, str):
+        time_calendar = None
+    # If we have custom units and calendar, use xarray's CF encoding function
+    # Only apply if both are actual strings (not Mock objects or None)
+    encode_time = time_units is not None and time_calendar is not None
+    # Only set calendar attribute if we have custom calendar (not default "standard")
+    if time_calendar == "standard":
+        time_calendar = None
+    # NOTE(PG): The attributes are the same for every split, so collect them once
+    #           and set them with a single update per dataset.
+    time_attrs = {
+        k: v
+        for k, v in (("units", time_units), ("calendar", time_calendar))
+        if v is not None
+    }
+
     # Ensure time encoding is properly applied to each dataset
     for i, ds in enumerate(datasets):
         if time_label in ds.variables:
-            # If we have custom units and calendar, use xarray's CF encoding function
-            # Only apply if both are actual strings (not Mock objects or None)
-            if (
-                "units" in time_encoding
-                and "calendar" in time_encoding
-                and isinstance(time_encoding["units"], str)
-                and isinstance(time_encoding["calendar"], str)
-            ):
-                from xarray.coding.times import encode_cf_datetime
-
+            if encode_time:
                 # Get the current time values (should be datetime objects)
                 time_values = ds[time_label].values
 
@@ -349,24 +365,16 @@ def _save_dataset_with_native_timespan(
 
                 # Replace the time coordinate with the encoded values
                 ds[time_label] = xr.DataArray(
-                    encoded_values, dims=[time_label], attrs=ds[time_label].attrs.copy()
+                    encoded_values,
+                    dims=[time_label],
+                    attrs=ds.variables[time_label].attrs.copy(),
                 )
 
-            # Set time units and calendar as attributes for consistency
-            # Only set if they are actual strings (not Mock objects)
-            # But avoid setting calendar attribute if it conflicts with encoding
-            if "units" in time_encoding and isinstance(time_encoding["units"], str):
-                ds[time_label].attrs["units"] = time_encoding["units"]
-            # Only set calendar attribute if we have custom calendar (not default "standard")
-            if (
-                "calendar" in time_encoding
-                and isinstance(time_encoding["calendar"], str)
-                and time_encoding["calendar"] != "standard"
-            ):
-                ds[time_label].attrs["calendar"] = time_encoding["calendar"]
+            time_var = ds.variables[time_label]
+            time_var.attrs.update(time_attrs)
 
             # Also set the encoding directly on the variable
-            ds[time_label].encoding.update(time_encoding)
+            time_var.encoding.update(time_encoding)
 
         paths.append(create_filepath(ds, rule))
 
@@ -436,14 +444,14 @@ def save_dataset(da: xr.DataArray, rule):
     # Set default calendar if none is specified
     if time_encoding.get("calendar") is None:
         time_encoding["calendar"] = "standard"
-    if not has_time_axis(da):
+    time_label = get_time_label(da)
+    if not time_label:
         filepath = create_filepath(da, rule)
         return da.to_netcdf(
             filepath,
             mode="w",
             format="NETCDF4",
         )
-    time_label = get_time_label(da)
     if is_scalar(da[time_label]):
         filepath = create_filepath(da, rule)
         return da.to_netcdf(
@@ -453,17 +461,21 @@ def save_dataset(da: xr.DataArray, rule):
             encoding={time_label: time_encoding},
             **extra_kwargs,
         )
+    # NOTE(PG): Convert once here, everything below can rely on having a Dataset.
     if isinstance(da, xr.DataArray):
         da = da.to_dataset()
 
     # Set time variable attributes
+    # NOTE(PG): da[time_label] builds a new DataArray on every access, but the
+    #           attributes belong to the underlying variable, so look that up once.
+    time_attrs = da.variables[time_label].attrs
     if rule._pycmor_cfg("xarray_time_set_standard_name"):
-        da[time_label].attrs["standard_name"] = "time"
+        time_attrs["standard_name"] = "time"
     if rule._pycmor_cfg("xarray_time_set_long_name"):
-        da[time_label].attrs["long_name"] = "time"
+        time_attrs["long_name"] = "time"
     if rule._pycmor_cfg("xarray_time_enable_set_axis"):
         time_axis_str = rule._pycmor_cfg("xarray_time_taxis_str")
-        da[time_label].attrs["axis"] = time_axis_str
+        time_attrs["axis"] = time_axis_str
     if rule._pycmor_cfg("xarray_time_remove_fill_value_attr"):
         time_encoding["_FillValue"] = None
 
@@ -475,12 +487,6 @@ def save_dataset(da: xr.DataArray, rule):
         and isinstance(time_encoding["units"], str)
         and isinstance(time_encoding["calendar"], str)
     ):
-        from xarray.coding.times import encode_cf_datetime
-
-        # Convert the dataset to Dataset if it's a DataArray
-        if isinstance(da, xr.DataArray):
-            da = da.to_dataset()
-
         # Get the current time values (should be datetime objects)
         time_values = da[time_label].values
 
@@ -493,26 +499,25 @@ def save_dataset(da: xr.DataArray, rule):
 
         # Replace the time coordinate with the encoded values
         da[time_label] = xr.DataArray(
-            encoded_values, dims=[time_label], attrs=da[time_label].attrs.copy()
+            encoded_values, dims=[time_label], attrs=time_attrs.copy()
         )
+        time_attrs = da.variables[time_label].attrs
 
     # Set time units and calendar as attributes (for metadata)
     # Only set if they are actual strings (not Mock objects)
     # But avoid setting calendar attribute if it conflicts with encoding
     if "units" in time_encoding and isinstance(time_encoding["units"], str):
-        da[time_label].attrs["units"] = time_encoding["units"]
+        time_attrs["units"] = time_encoding["units"]
     # Only set calendar attribute if we have custom calendar (not default "standard")
     if (
         "calendar" in time_encoding
         and isinstance(time_encoding["calendar"], str)
         and time_encoding["calendar"] != "standard"
     ):
-        da[time_label].attrs["calendar"] = time_encoding["calendar"]
+        time_attrs["calendar"] = time_encoding["calendar"]
 
     # Ensure the encoding is set on the time variable itself
-    if isinstance(da, xr.DataArray):
-        da = da.to_dataset()
-    da[time_label].encoding.update(time_encoding)
+    da.variables[time_label].encoding.update(time_encoding)
 
     if not has_time_axis(da):
         filepath = create_filepath(da, rule)
@@ -19,6 +19,7 @@ The Full CMOR (yes, bad pun):
 
 import re
 import tempfile
+import time
 from pathlib import Path
 
 import xarray as xr
@@ -185,8 +186,6 @@ def dummy_sleep(data, rule_spec, *arg, **kwargs):
     """
     A dummy function for testing. Sleeps for 5 seconds.
     """
-    import time
-
     time.sleep(5)
     return data
 
@@ -27,6 +27,15 @@ class CMIP7GlobalAttributes(GlobalAttributes):
 
 
 class CMIP6GlobalAttributes(GlobalAttributes):
+    _VARIANT_LABEL_PATTERN = re.compile(
+        r"r(?P<realization_index>\d+)"
+        r"i(?P<initialization_index>\d+)"
+        r"p(?P<physics_index>\d+)"
+        r"f(?P<forcing_index>\d+)"
+        r"$"
+    )
+    """re.Pattern: Splits a variant label into its indices, shared by all instances."""
+
     def __init__(self, drv, cv, rule_dict):
         self.drv = drv
         self.cv = cv
@@ -61,14 +70,7 @@ class CMIP6GlobalAttributes(GlobalAttributes):
         return directory_path
 
     def _variant_label_components(self, label: str):
-        pattern = re.compile(
-            r"r(?P<realization_index>\d+)"
-            r"i(?P<initialization_index>\d+)"
-            r"p(?P<physics_index>\d+)"
-            r"f(?P<forcing_index>\d+)"
-            r"$"
-        )
-        d = pattern.match(label)
+        d = self._VARIANT_LABEL_PATTERN.match(label)
         if d is None:
             raise ValueError(
                 f"`label` must be of the form 'r<int>i<int>p<int>f<int>', Got: {label}"
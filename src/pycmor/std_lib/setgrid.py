@@ -34,6 +34,7 @@ The bounds calculation:
 - Works for both regular and irregular grids
 """
 
+from itertools import chain
 from typing import Union
 
 import xarray as xr
@@ -71,24 +72,32 @@ def setgrid(
     # Add bounds if they don't exist
     grid = add_bounds_to_grid(grid)
 
-    required_dims = set(sum([gc.dims for _, gc in grid.coords.items()], ()))
+    # NOTE(PG): One pass over the coordinate variables, instead of concatenating
+    #           the dimension tuples of one DataArray per coordinate with sum().
+    required_dims = set(
+        chain.from_iterable(gc.dims for gc in grid.coords.variables.values())
+    )
     logger.info(f"  → Required Dimensions: {sorted(required_dims)}")
     to_rename = {}
     can_merge = False
+    # NOTE(PG): .sizes builds a new mapping on every access (for a DataArray from
+    #           its dims and shape), so take both once rather than per dimension.
+    grid_sizes = grid.sizes
+    data_sizes = da.sizes
     for dim in required_dims:
-        dimsize = grid.sizes[dim]
-        if dim in da.sizes:
+        dimsize = grid_sizes[dim]
+        if dim in data_sizes:
             can_merge = True
-            if da.sizes[dim] != dimsize:
+            if data_sizes[dim] != dimsize:
                 raise ValueError(
-                    f"Mismatch dimension sizes {dim} {dimsize} (grid) {da.sizes[dim]} (data)"
+                    f"Mismatch dimension sizes {dim} {dimsize} (grid) {data_sizes[dim]} (data)"
                 )
             logger.info(f"  → Dimension '{dim}' : ✅ Found (size={dimsize})")
         else:
             logger.info(
                 f"  → Dimension '{dim}' : ❌ Not found, checking for size matches..."
             )
-            for name, _size in da.sizes.items():
+            for name, _size in data_sizes.items():
                 if dimsize == _size:
                     can_merge = True
                     to_rename[name] = dim
@@ -25,8 +25,12 @@ Module Variables
 _IGNORED_CELL_METHODS : list
     List of cell_methods to ignore when calculating time averages.
 
+_OFFSET_PRESETS : dict
+    Named values accepted for ``adjust_timestamp``, as fractions of the interval.
+
 """
 
+import functools
 import re
 
 import pandas as pd
@@ -34,6 +38,16 @@ import xarray as xr
 
 from ..core.logging import logger
 
+_OFFSET_PRESETS = {
+    "first": 0,
+    "start": 0,
+    "last": 1,
+    "end": 1,
+    "mid": 0.5,
+    "middle": 0.5,
+}
+"""dict: Named ``adjust_timestamp`` values, mapped to a fraction of the interval."""
+
 
 def _get_time_method(frequency: str) -> str:
     """
@@ -54,11 +68,12 @@ def _get_time_method(frequency: str) -> str:
     """
     if frequency.endswith("Pt"):
         return "INSTANTANEOUS"
-    if frequency.endswith("C") or frequency.endswith("CM"):
+    if frequency.endswith(("C", "CM")):
         return "CLIMATOLOGY"
     return "MEAN"
 
 
+@functools.lru_cache(maxsize=32)
 def _frequency_from_approx_interval(interval: str):
     """
     Convert an interval expressed in days to a frequency string.
@@ -66,6 +81,7 @@ def _frequency_from_approx_interval(interval: str):
     This function takes an interval expressed in days and converts it to a frequency string
     in a suitable time unit (decade, year, month, day, hour, minute, second, millisecond).
     The conversion is based on an approximate number of days for each time unit.
+    Results are cached, since the tables only use a handful of distinct intervals.
 
     Parameters
     ----------
@@ -171,15 +187,7 @@ def timeavg(da: xr.DataArray, rule):
     elif time_method == "MEAN":
         ds = da.resample(time=frequency_str).mean()
         offset = rule.get("adjust_timestamp", None)
-        offset_presets = {
-            "first": 0,
-            "start": 0,
-            "last": 1,
-            "end": 1,
-            "mid": 0.5,
-            "middle": 0.5,
-        }
-        offset = offset_presets.get(offset, offset)
+        offset = _OFFSET_PRESETS.get(offset, offset)
         if offset is None:
             return ds
         try:
@@ -29,7 +29,9 @@ def set_variable_attrs(
 
     # Use the associated data_request_variable to set the variable attributes
     missing_value = rule._pymor_cfg("xarray_default_missing_value")
-    attrs = rule.data_request_variable.attrs.copy()  # avoid modifying original
+    # NOTE(PG): attrs builds a new dict on every access, so it can be modified
+    #           here without copying it first.
+    attrs = rule.data_request_variable.attrs
 
     # Set missing value in attrs if not present
     for attr in ["missing_value", "_FillValue"]:
@@ -48,7 +50,7 @@ def set_variable_attrs(
 
     logger.info("Setting the following attributes:")
     for k, v in attrs.items():
-        logger.info(f"{k}: {v}")
+        logger.info("{}: {}", k, v)
     da.attrs.update(attrs)
 
     # Set encoding for missing values:
@@ -169,7 +169,7 @@ def show_selected_variable(varname):
     for t, f in res:
         if f.endswith("Pt"):
             kind = "Instantaneous"
-        elif f.endswith("C") or f.endswith("CM"):
+        elif f.endswith(("C", "CM")):
             kind = "Climatology"
         else:
             kind = "Mean"
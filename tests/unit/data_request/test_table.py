@@ -1,3 +1,5 @@
+import pytest
+
 from pycmor.data_request.table import CMIP7DataRequestTable
 
 
@@ -5,3 +7,12 @@ def test_cmip7_from_vendored_json():
     drt = CMIP7DataRequestTable.from_all_var_info_json("Omon")
     # For right now, just check if the object is creatable
     assert drt is not None
+
+
+def test_cmip7_get_variable():
+    drt = CMIP7DataRequestTable.from_all_var_info_json("Omon")
+    drv = drt.get_variable("thetao")
+    assert drv.name == "thetao"
+    assert drt.get_variable("thetao") is drv
+    with pytest.raises(ValueError):
+        drt.get_variable("not_a_variable")
@@ -5,6 +5,8 @@ Tests for DataRequestVariable
 from pycmor.data_request.variable import (
     CMIP6JSONDataRequestVariable,
     CMIP7DataRequestVariable,
+    load_json_table,
+    load_vendored_all_var_info,
 )
 
 
@@ -18,8 +20,36 @@ def test_cmip6_init_from_json_file():
     assert drv.table_name == "Omon"
 
 
+def test_cmip6_json_table_is_parsed_once():
+    table_file = "cmip6-cmor-tables/Tables/CMIP6_Omon.json"
+    data = load_json_table(table_file)
+    assert load_json_table(table_file) is data
+    CMIP6JSONDataRequestVariable.from_json_file(table_file, "thetao")
+    assert "table_name" not in data["variable_entry"]["thetao"]
+
+
 def test_cmip7_from_vendored_json():
     drv = CMIP7DataRequestVariable.from_all_var_info_json("thetao", "Omon")
     assert drv.name == "thetao"
     assert drv.frequency == "mon"
     assert drv.table_name == "Omon"
+
+
+def test_cmip7_vendored_json_is_parsed_once():
+    assert load_vendored_all_var_info() is load_vendored_all_var_info()
+
+
+def test_cmip7_vendored_json_shares_repeated_values():
+    all_var_info = load_vendored_all_var_info()["Compound Name"]
+    assert (
+        all_var_info["Omon.thetao"]["frequency"] is all_var_info["Omon.so"]["frequency"]
+    )
+
+
+def test_cmip7_clone_shares_table_header():
+    drv = CMIP7DataRequestVariable.from_all_var_info_json("thetao", "Omon")
+    drv.table_header = object()
+    clone = drv.clone()
+    assert clone is not drv
+    assert clone == drv
+    assert clone.table_header is drv.table_header
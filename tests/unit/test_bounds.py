@@ -306,3 +306,43 @@ def test_bounds_with_two_points():
     midpoint = (lat[0].values + lat[1].values) / 2
     assert bounds[0, 1].values == midpoint
     assert bounds[1, 0].values == midpoint
+
+
+def test_bounds_dtype():
+    """Test that float32 grids stay float32 and integer grids become float."""
+    lat32 = xr.DataArray(np.array([10.0, 20.0, 30.0], dtype=np.float32), dims=["lat"])
+    assert calculate_bounds_1d(lat32).dtype == np.float32
+
+    lat_int = xr.DataArray([10, 15, 25], dims=["lat"])
+    bounds = calculate_bounds_1d(lat_int)
+    assert bounds.dtype == np.float64
+    np.testing.assert_array_equal(bounds.values[:, 1], [12.5, 20.0, 30.0])
+
+
+def test_bounds_small_integer_coord_does_not_overflow():
+    """Integer coordinates are promoted before the midpoints are summed"""
+    for dtype in (np.int8, np.int16):
+        coord = xr.DataArray(
+            np.array([100, 120], dtype=dtype), dims=["lev"], name="lev"
+        )
+        bounds = calculate_bounds_1d(coord)
+        np.testing.assert_allclose(bounds.values, [[90.0, 110.0], [110.0, 130.0]])
+
+
+def test_bounds_dask_backed_coord_stays_lazy():
+    """Test that bounds of a dask-backed coordinate are computed lazily."""
+    lat = xr.DataArray(np.linspace(-87.5, 87.5, 36), dims=["lat"], name="lat")
+    bounds = calculate_bounds_1d(lat.chunk({"lat": 10}))
+
+    assert bounds.chunks is not None
+    assert bounds.dims == ("lat", "bnds")
+    np.testing.assert_array_equal(bounds.values, calculate_bounds_1d(lat).values)
+
+
+def test_bounds_long_name():
+    """Test that the bounds long_name falls back to the coordinate name, if any."""
+    lat = xr.DataArray([10.0, 20.0, 30.0], dims=["lat"], name="lat")
+    assert calculate_bounds_1d(lat).attrs["long_name"] == "lat bounds"
+
+    unnamed = xr.DataArray([10.0, 20.0, 30.0], dims=["lat"])
+    assert "long_name" not in calculate_bounds_1d(unnamed).attrs
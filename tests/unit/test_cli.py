@@ -0,0 +1,71 @@
+import datetime
+
+import rich_click as click
+import yaml
+from click.testing import CliRunner
+
+from pycmor.cli import _fast_deepcopy, cli
+
+
+def test_fast_deepcopy_keeps_yaml_aliases_shared():
+    # The date makes marshal give up, so this goes through the fallback copy
+    cfg = yaml.safe_load(
+        """
+        base: &base {a: 1, levels: [1, 2]}
+        rules:
+          - {inherit: *base, start: 2020-01-01}
+          - {inherit: *base}
+        """
+    )
+    assert isinstance(cfg["rules"][0]["start"], datetime.date)
+
+    copied = _fast_deepcopy(cfg)
+
+    assert copied == cfg
+    assert copied["base"] is not cfg["base"]
+    assert copied["base"]["levels"] is not cfg["base"]["levels"]
+    assert copied["rules"][0]["inherit"] is copied["base"]
+    assert copied["rules"][1]["inherit"] is copied["base"]
+
+
+class FakePluginEntryPoint:
+    """Stands in for a plugin's entry point, recording whether it was loaded."""
+
+    name = "fancy-plugin"
+    module_name = "pycmor_fancy_plugin.cli"
+
+    def __init__(self):
+        self.loads = 0
+
+    def load(self):
+        self.loads += 1
+
+        @click.command(help="Does fancy things.")
+        def fancy_plugin():
+            click.echo("fancy plugin ran")
+
+        return fancy_plugin
+
+
+def test_help_does_not_load_plugins(monkeypatch):
+    entry_point = FakePluginEntryPoint()
+    monkeypatch.setitem(cli.lazy_subcommands, entry_point.name, entry_point)
+
+    result = CliRunner().invoke(cli, ["--help"])
+
+    assert result.exit_code == 0, result.output
+    assert entry_point.name in result.output
+    assert "pycmor_fancy_plugin" in result.output
+    assert entry_point.loads == 0
+
+
+def test_plugin_is_loaded_once_when_invoked(monkeypatch):
+    entry_point = FakePluginEntryPoint()
+    monkeypatch.setitem(cli.lazy_subcommands, entry_point.name, entry_point)
+    monkeypatch.setattr(cli, "_loaded_subcommands", {})
+
+    for _ in range(2):
+        result = CliRunner().invoke(cli, [entry_point.name])
+        assert result.exit_code == 0, result.output
+        assert "fancy plugin ran" in result.output
+    assert entry_point.loads == 1
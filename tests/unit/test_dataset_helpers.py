@@ -208,3 +208,19 @@ def test_unknown_frequency_raises():
     ds = xr.Dataset({"temp": ("time", np.random.rand(3))}, coords={"time": time})
     with pytest.raises(ValueError, match="Could not infer frequency"):
         freq_is_coarser_than_data("D", ds)
+
+
+def test_get_time_label_does_not_load_lazy_coordinates():
+    dask_array = pytest.importorskip("dask.array")
+    from dask import delayed
+
+    def fail():
+        raise AssertionError("coordinate values were loaded")
+
+    time = pd.date_range("2000-01-01", periods=3)
+    lazy = dask_array.from_delayed(delayed(fail)(), shape=(3,), dtype=float)
+    ds = xr.Dataset(
+        {"tas": ("time", np.ones(3))},
+        coords={"time": time, "height": ("time", lazy)},
+    )
+    assert get_time_label(ds) == "time"